@@ -5,7 +5,18 @@ Simple agent manager test without emoji issues
 
 import sys
 import os
+import re
+import mmap
+from collections import Counter
 from pathlib import Path
+from typing import Dict
+
+# Only the id and top-level status are needed, so pull them out of each raw
+# row instead of decoding the whole agent object. agent_manager writes both
+# ahead of any nested object, so the first match in a row is the top-level one.
+STATUS_RE = re.compile(rb'"status"\s*:\s*"([^"]+)"')
+ID_RE = re.compile(rb'"id"\s*:\s*"([^"]+)"')
+ROW_RE = re.compile(rb'^[ \t]*(\S[^\n]*)', re.MULTILINE)
 
 def test_agent_system():
     """Test basic agent system functionality"""
@@ -15,43 +26,47 @@ def test_agent_system():
     print("Stratavore Agent System Test")
     print("=" * 40)
     
-    # Check if agents file exists
-    if not agents_file.exists():
-        print(f"ERROR: Agents file not found: {agents_file}")
-        return False
-    
-    print(f"Agents file: {agents_file}")
-    
     # Count agents
     try:
-        with open(agents_file, 'r', encoding='utf-8') as f:
-            content = f.read().strip()
-            if not content:
+        with open(agents_file, 'rb') as f:
+            print(f"Agents file: {agents_file}")
+            
+            if os.fstat(f.fileno()).st_size == 0:
                 print("No agents found")
                 return True
-                
-            lines = [line for line in content.split('\n') if line.strip()]
-            print(f"Total agents: {len(lines)}")
             
-            # Simple status breakdown
-            status_counts = {}
-            for line in lines:
-                parts = line.split(' ', 1)
-                if len(parts) == 2:
-                    try:
-                        import json
-                        agent_data = json.loads(parts[1])
-                        status = agent_data.get('status', 'unknown')
-                        status_counts[status] = status_counts.get(status, 0) + 1
-                    except:
-                        pass
+            # The file is an append log, so only the last row per agent id
+            # counts. Rows are bare JSON or, in older files, "<id> <json>".
+            latest: Dict[bytes, bytes] = {}
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for row in ROW_RE.finditer(mm):
+                    line = row.group(1)
+                    if line[:1] == b'{':
+                        id_match = ID_RE.search(line)
+                        if id_match is None:
+                            continue
+                        agent_id = id_match.group(1)
+                    else:
+                        agent_id = line.split(b' ', 1)[0]
+                    status = STATUS_RE.search(line)
+                    latest[agent_id] = status.group(1) if status else b'unknown'
+            
+            if not latest:
+                print("No agents found")
+                return True
+            
+            print(f"Total agents: {len(latest)}")
+            status_counts: Counter[bytes] = Counter(latest.values())
             
             for status, count in status_counts.items():
-                print(f"  {status}: {count}")
+                print(f"  {status.decode('utf-8')}: {count}")
             
             return True
             
-    except Exception as e:
+    except FileNotFoundError:
+        print(f"ERROR: Agents file not found: {agents_file}")
+        return False
+    except (OSError, ValueError) as e:
         print(f"Error reading agents: {e}")
         return False
 
@@ -5,58 +5,193 @@ Cross-platform wrapper for Stratavore agent manager with proper encoding handlin
 
 import sys
 import os
+import importlib.machinery
+import shlex
+import socket
 import subprocess
 import json
 from pathlib import Path
 
+# Find agent manager - go up from .opencode/tools to repo root. Resolved
+# once at import and kept as str so nothing is re-stringified per call.
+_REPO_ROOT = Path(__file__).parent.parent.parent
+_AGENTS_DIR = _REPO_ROOT / "agents"
+AGENT_MANAGER_PATH = str(_AGENTS_DIR / "agent_manager.py")
+JOB_TOOLS_PATH = str(_REPO_ROOT / "jobs" / "job_tools.py")
+AGENT_MANAGER_EXISTS = os.path.exists(AGENT_MANAGER_PATH)
+JOB_TOOLS_EXISTS = os.path.exists(JOB_TOOLS_PATH)
+
+# `make py-aot` drops a mypyc-compiled agent_manager extension next to the
+# source; import it instead of interpreting agent_manager.py when present.
+AGENT_MANAGER_COMPILED = any(
+    os.path.exists(str(_AGENTS_DIR / f"agent_manager{suffix}"))
+    for suffix in importlib.machinery.EXTENSION_SUFFIXES
+)
+if AGENT_MANAGER_COMPILED:
+    AGENT_MANAGER_CMD = [
+        sys.executable, "-c",
+        f"import sys; sys.path.insert(0, {str(_AGENTS_DIR)!r}); "
+        "import agent_manager; sys.exit(agent_manager.main())",
+    ]
+else:
+    AGENT_MANAGER_CMD = [sys.executable, AGENT_MANAGER_PATH]
+
+DAEMON_PID_FILE = str(_AGENTS_DIR / ".daemon.pid")
+DAEMON_SOCKET = str(_AGENTS_DIR / ".daemon.sock")
+DAEMON_SENTINEL = b"\x1e"
+
+# "summary" and "assign" exist in both tools; they have always resolved to
+# agent_manager, so they are only listed there.
+AGENT_COMMANDS = frozenset({"spawn", "assign", "complete", "status", "list", "summary", "personalities", "available", "unstuck-spawning", "export-json"})
+JOB_COMMANDS = frozenset({"validate", "ready", "conflicts", "all"})
+
+# Built once; only the child gets the forced UTF-8 stdio encoding
+CHILD_ENV = {**os.environ, 'PYTHONIOENCODING': 'utf-8'}
+
+class DaemonError(Exception):
+    """The daemon took a request but did not answer it completely.
+    
+    The command may already have been applied, so it must not be retried.
+    """
+
+def daemon_request(command, args):
+    """Send a command to a running agent_manager daemon.
+    
+    Returns the command output, or None if no daemon is reachable so the
+    caller can fall back to spawning a fresh interpreter. Raises
+    DaemonError if anything fails once the daemon has accepted the
+    connection, since the command may already have run.
+    """
+    if os.name != "posix" or not hasattr(socket, "AF_UNIX"):
+        return None
+    
+    try:
+        with open(DAEMON_PID_FILE, 'r') as f:
+            pid = int(f.read().strip())
+        os.kill(pid, 0)  # Stale pidfile check
+    except (OSError, ValueError):
+        return None
+    
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(30)
+        sock.connect(DAEMON_SOCKET)
+    except OSError:
+        sock.close()
+        return None
+    
+    chunks = []
+    complete = False
+    with sock:
+        try:
+            sock.sendall((json.dumps({"cmd": command, "args": args}) + "\n").encode('utf-8'))
+            while True:
+                data = sock.recv(65536)
+                if not data:
+                    break
+                chunks.append(data)
+                if data.endswith(DAEMON_SENTINEL):
+                    complete = True
+                    break
+        except OSError as e:
+            raise DaemonError(f"{command}: {e}") from e
+    if not complete:
+        raise DaemonError(f"{command}: connection closed before the response ended")
+    
+    return b"".join(chunks)[:-len(DAEMON_SENTINEL)].decode('utf-8')
+
+def parse_batch(stream):
+    """Parse newline-separated agent commands for the batch command.
+    
+    Blank lines and '#' comments are skipped. Returns a list of argv lists,
+    or None after printing an error if any line is unusable.
+    """
+    commands = []
+    for raw in stream:
+        line = raw.strip()
+        if not line or line.startswith('#'):
+            continue
+        try:
+            argv = shlex.split(line)
+        except ValueError as e:
+            print(f"ERROR: Could not parse batch line {line!r}: {e}")
+            return None
+        if argv[0] not in AGENT_COMMANDS:
+            print(f"ERROR: Unsupported batch command: {argv[0]}")
+            return None
+        commands.append(argv)
+    return commands
+
 def main():
     """Main wrapper function"""
     if len(sys.argv) < 2:
         print("Usage: python stratavore_wrapper.py [command] [args...]")
         return 1
     
-    # Find agent manager - go up from .opencode/tools to repo root
-    script_dir = Path(__file__).parent.parent.parent  # From .opencode/tools to repo root
-    agents_dir = script_dir / "agents"
-    agent_manager = agents_dir / "agent_manager.py"
-    job_tools = script_dir / "jobs" / "job_tools.py"
-    
-    if not agent_manager.exists():
-        print(f"ERROR: Agent manager not found: {agent_manager}")
+    if not AGENT_MANAGER_EXISTS:
+        print(f"ERROR: Agent manager not found: {AGENT_MANAGER_PATH}")
         return 1
     
     # Build command
     command = sys.argv[1]
     args = sys.argv[2:]
     
-    if command in ["spawn", "assign", "complete", "status", "list", "summary", "personalities", "available", "unstuck-spawning"]:
-        cmd = [sys.executable, str(agent_manager), command] + args
-    elif command in ["validate", "summary", "ready", "conflicts", "assign", "all"]:
-        if not job_tools.exists():
-            print(f"ERROR: Job tools not found: {job_tools}")
+    stdin_data = None
+    
+    if command == "batch":
+        # One interpreter (or the daemon) runs every command read from stdin
+        commands = parse_batch(sys.stdin)
+        if commands is None:
+            return 1
+        if not commands:
+            return 0
+        try:
+            output = daemon_request(commands[0][0], commands[0][1:])
+            if output is not None:
+                print(output, end='')
+                for argv in commands[1:]:
+                    output = daemon_request(argv[0], argv[1:])
+                    if output is None:
+                        print("ERROR: Agent daemon stopped responding mid-batch")
+                        return 1
+                    print(output, end='')
+                return 0
+        except DaemonError as e:
+            print(f"ERROR: Agent daemon failed mid-request, not retrying: {e}")
+            return 1
+        cmd = AGENT_MANAGER_CMD + ["batch"]
+        stdin_data = "".join(shlex.join(argv) + "\n" for argv in commands).encode('utf-8')
+    elif command in AGENT_COMMANDS:
+        try:
+            output = daemon_request(command, args)
+        except DaemonError as e:
+            print(f"ERROR: Agent daemon failed mid-request, not retrying: {e}")
             return 1
-        cmd = [sys.executable, str(job_tools), command] + args
+        if output is not None:
+            print(output, end='')
+            return 0
+        cmd = AGENT_MANAGER_CMD + [command] + args
+    elif command in JOB_COMMANDS:
+        if not JOB_TOOLS_EXISTS:
+            print(f"ERROR: Job tools not found: {JOB_TOOLS_PATH}")
+            return 1
+        cmd = [sys.executable, JOB_TOOLS_PATH, command] + args
     else:
         print(f"ERROR: Unknown command: {command}")
         return 1
     
     try:
-        # Execute with proper encoding
+        # Child inherits our stdout/stderr and writes to them directly.
+        # close_fds=False lets subprocess use posix_spawn instead of
+        # fork+exec on POSIX.
         result = subprocess.run(
             cmd,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
+            input=stdin_data,
+            close_fds=False,
             timeout=30,
-            env={**os.environ, 'PYTHONIOENCODING': 'utf-8'}
+            env=CHILD_ENV
         )
         
-        if result.stdout:
-            print(result.stdout, end='')
-        
-        if result.stderr:
-            print(result.stderr, file=sys.stderr)
-        
         return result.returncode
         
     except subprocess.TimeoutExpired:
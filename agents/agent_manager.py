@@ -4,17 +4,155 @@ Agent Manager - Handles multiple parallel agents with different personalities
 Manages agent spawning, task assignment, and status monitoring
 """
 
+import heapq
+import io
+import itertools
 import json
 import os
+import pickle
 import time
+import shlex
 import sys
+import signal
+import socket
+import struct
 import subprocess
 import threading
 import uuid
+from collections import defaultdict, deque
+from contextlib import contextmanager, redirect_stdout
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import IO, Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 from enum import Enum
 
+try:
+    import orjson  # Optional; several times faster than the stdlib codec
+    _HAVE_ORJSON = True
+except ImportError:
+    _HAVE_ORJSON = False
+
+try:
+    import fcntl  # POSIX only; elsewhere appends and compactions are not serialized
+except ImportError:
+    fcntl = None  # type: ignore[assignment]
+
+_AGENTS_DIR = os.path.dirname(os.path.abspath(__file__))
+DAEMON_PID_FILE = os.path.join(_AGENTS_DIR, ".daemon.pid")
+DAEMON_SOCKET = os.path.join(_AGENTS_DIR, ".daemon.sock")
+DAEMON_SENTINEL = "\x1e"  # Terminates each daemon response
+
+# Agent todos are mirrored here when running inside the OpenCode checkout
+OPENCODE_REPO = "/home/meridian/strat/Stratavore"
+OPENCODE_TODOS_FILE = "/tmp/opencode_agent_todos.jsonl"
+
+# Write-behind tuning: dirty agents are appended after this many seconds,
+# or sooner once this many are pending.
+FLUSH_INTERVAL = 0.05
+FLUSH_MAX_PENDING = 64
+
+# Agent state is guarded by one of this many locks, picked by agent id
+LOCK_STRIPES = 16
+
+# Each agent keeps only its most recent thoughts
+MAX_THOUGHTS = 50
+
+# Seconds a freshly spawned agent spends in SPAWNING before going IDLE
+SPAWN_DELAY = 2.0
+
+# A thought repeated within this many seconds is dropped as a duplicate
+THOUGHT_DEDUP_WINDOW = 1.0
+
+# Opt-in: persist agents as length-prefixed pickle frames in
+# active_agents.bin instead of JSONL. The webui and the status tools only
+# read active_agents.jsonl; refresh it with the export-json command.
+AGENTS_BINLOG = os.environ.get("STRATAVORE_AGENTS_BINLOG", "") not in ("", "0")
+_FRAME = struct.Struct("<I")
+
+def _encode_default(obj: Any) -> Any:
+    """JSON fallback for the thought deques, written out as plain lists"""
+    if isinstance(obj, deque):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+# Stdlib fallback for _dumps, configured once rather than per json.dumps
+# call. Like orjson it writes non-ASCII text as raw UTF-8.
+_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False, default=_encode_default)
+_encode = _ENCODER.encode
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj as one compact JSON line (without the newline)"""
+    if _HAVE_ORJSON:
+        return orjson.dumps(obj, default=_encode_default)
+    return _encode(obj).encode('utf-8')
+
+def _loads(data: Union[bytes, memoryview]) -> Any:
+    """Parse one JSON record; raises json.JSONDecodeError on bad input"""
+    if _HAVE_ORJSON:
+        return orjson.loads(data)  # Reads memoryviews in place
+    return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+_uuid7_last = 0
+_uuid7_lock = threading.Lock()
+
+def _uuid7() -> str:
+    """Time-ordered UUID (version 7): 48-bit Unix milliseconds, then random bits.
+    
+    Ids from one process are strictly increasing, even within a millisecond.
+    """
+    global _uuid7_last
+    rand = int.from_bytes(os.urandom(10), 'big')
+    value = ((time.time_ns() // 1_000_000) << 80 | 0x7 << 76 | (rand >> 68) << 64
+             | 0b10 << 62 | rand & ((1 << 62) - 1))
+    with _uuid7_lock:
+        if value <= _uuid7_last:
+            value = _uuid7_last + 1
+        _uuid7_last = value
+    return str(uuid.UUID(int=value))
+
+def _snapshot(data: Dict) -> Dict:
+    """Copy an agent record and its nested containers for encoding.
+    
+    Mutators edit agent dicts outside the stripe locks, so encoding the live
+    record could see a dict or deque change size mid-encode.
+    """
+    data = data.copy()  # A single C-level copy; iterating the original is not safe
+    return {key: value.copy() if isinstance(value, (dict, list, deque)) else value
+            for key, value in data.items()}
+
+def _frame(obj: Any) -> bytes:
+    """Encode obj as one binary log frame"""
+    payload = pickle.dumps(obj, protocol=5)
+    return _FRAME.pack(len(payload)) + payload
+
+def _read_frames(data: bytes) -> Tuple[List[Any], int]:
+    """Decode the frames in data; also returns how many bytes were whole frames"""
+    view = memoryview(data)
+    objs = []
+    pos = 0
+    while pos + _FRAME.size <= len(view):
+        (size,) = _FRAME.unpack_from(view, pos)
+        end = pos + _FRAME.size + size
+        if end > len(view):
+            break  # Torn final frame from an interrupted write
+        objs.append(pickle.loads(view[pos + _FRAME.size:end]))
+        pos = end
+    return objs, pos
+
+def _parse_record(line: bytes) -> Optional[Dict]:
+    """Parse a JSONL record keyed by its own "id" field.
+    
+    Older files prefixed each line with "<id> "; those are still accepted.
+    Returns None for records without an id.
+    """
+    if line[:1] == b'{':
+        record = _loads(line)
+    else:
+        # Parse the payload after the id without copying it out of the line
+        record = _loads(memoryview(line)[line.find(b' ') + 1:])
+    if not isinstance(record, dict) or "id" not in record:
+        return None
+    return record
+
 class AgentStatus(Enum):
     IDLE = "idle"
     WORKING = "working"
@@ -31,21 +169,164 @@ class AgentPersonality(Enum):
     DEBUGGER = "debugger"
     OPTIMIZER = "optimizer"
 
+# Plain-dict lookups for CLI input; a miss is None instead of a ValueError
+_STATUS_BY_VALUE = {s.value: s for s in AgentStatus}
+_PERSONALITY_BY_VALUE = {p.value: p for p in AgentPersonality}
+
 class AgentManager:
-    def __init__(self):
+    def __init__(self, write_behind: bool = True, base_dir: Optional[str] = None):
+        # write_behind=False writes every save before it returns, for
+        # short-lived managers (e.g. one per web request) that never flush
+        self._write_behind = write_behind
         # Resolve paths relative to this file so the manager works correctly
         # regardless of the current working directory (e.g. when imported by
-        # webui/server.py which chdir-s to the webui/ folder).
-        _here = os.path.dirname(os.path.abspath(__file__))
+        # webui/server.py which chdir-s to the webui/ folder); base_dir
+        # points it at another directory of agent files instead.
+        _here = base_dir if base_dir is not None else os.path.dirname(os.path.abspath(__file__))
         self.agents_file = os.path.join(_here, "active_agents.jsonl")
+        self.agents_binlog_file = os.path.join(_here, "active_agents.bin")
+        self._binlog = AGENTS_BINLOG
+        # Where agent records are appended: the binary log when enabled
+        self._agent_log = self.agents_binlog_file if self._binlog else self.agents_file
         self.personalities_file = os.path.join(_here, "agent_personalities.json")
         self.commands_file = os.path.join(_here, "agent_commands.jsonl")
         self.todos_file = os.path.join(_here, "agent_todos.jsonl")
         self._lock = threading.Lock()  # Protects concurrent file writes
+        # path -> O_APPEND descriptor reused across writes (see _append_bytes)
+        self._fds: Dict[str, int] = {}
+        # path -> descriptor of its ".lock" file, flock()ed around appends
+        # (shared) and compaction (exclusive) so a compaction in one process
+        # cannot drop records another process appended (see _log_lock)
+        self._lock_fds: Dict[str, int] = {}
+        # path -> (inode, size) of the prefix of that log already loaded
+        # into memory; compaction re-reads only what follows it
+        self._loaded: Dict[str, Tuple[int, int]] = {}
+        self._log_records = 0  # Lines in agents_file, including superseded ones
+        # agent id -> its latest encoded log record, reused by compaction
+        # so unchanged agents are not serialized again
+        self._encoded: Dict[str, bytes] = {}
+        # Striped locks for agent mutations, each with its own write-behind
+        # set of agent ids saved since the last flush
+        self._stripes = [threading.Lock() for _ in range(LOCK_STRIPES)]
+        self._dirty: List[Set[str]] = [set() for _ in range(LOCK_STRIPES)]
+        self._flush_cv = threading.Condition()  # Guards _flusher start/stop
+        self._flusher: Optional[threading.Thread] = None
+        self._flush_interval = FLUSH_INTERVAL
+        # (monotonic deadline, agent_id) heap of pending spawn completions,
+        # served by one timer thread instead of a sleeping thread per spawn
+        self._timers: List[Tuple[float, str]] = []
+        self._timer_cv = threading.Condition()
+        self._timer_thread: Optional[threading.Thread] = None
+        # id -> todo, loaded from todos_file on first use (see _todo_index)
+        self._todos: Optional[Dict[str, Dict]] = None
+        self._todo_log_records = 0
+        # Checked once; the OpenCode mirror file is opened on first use
+        self._opencode_enabled = os.path.exists(OPENCODE_REPO)
+        self._opencode_todos: Optional[IO[str]] = None
+        # Reverse indexes (status or personality -> agent ids) and totals
+        # kept in step with every change, so summaries and listings do not
+        # rescan all agents. Ids are dict keys to keep listings in order.
+        self._index_lock = threading.Lock()
+        self._by_status: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._by_personality: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._tasks_completed = 0
+        # SPAWNING agent id -> spawn time (epoch seconds), so recovery only
+        # looks at agents that can actually be stuck
+        self._spawning: Dict[str, float] = {}
+        # agent id -> monotonic time of its last add_agent_thought
+        self._last_thought_at: Dict[str, float] = {}
         self.ensure_files_exist()
-        self.agents = {}
+        self.agents: Dict[str, Dict] = {}
         self.load_agent_data()
     
+    def close(self):
+        """Flush buffered agents and release the cached file descriptors"""
+        self.flush()
+        with self._lock:
+            for path in list(self._fds):
+                self._close_fd(path)
+            for fd in self._lock_fds.values():
+                os.close(fd)
+            self._lock_fds.clear()
+            if self._opencode_todos is not None:
+                self._opencode_todos.close()
+                self._opencode_todos = None
+    
+    def __del__(self):
+        # Raw descriptors are not closed by the GC; never flush from here
+        for fd in [*getattr(self, "_fds", {}).values(), *getattr(self, "_lock_fds", {}).values()]:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+    
+    @contextmanager
+    def _log_lock(self, path: str, exclusive: bool) -> Iterator[None]:
+        """Hold path's log lock: shared to append, exclusive to replace. Caller holds _lock."""
+        if fcntl is None:
+            yield
+            return
+        fd = self._lock_fds.get(path)
+        if fd is None:
+            fd = self._lock_fds[path] = os.open(path + ".lock",
+                                                os.O_RDWR | os.O_CREAT | getattr(os, "O_CLOEXEC", 0), 0o644)
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    
+    def _append_bytes(self, path: str, payload: bytes):
+        """Append payload to path via a cached O_APPEND descriptor. Caller holds _lock."""
+        # Shared: other appenders may write alongside, but no compaction
+        # can replace the file between the inode check and the write
+        with self._log_lock(path, exclusive=False):
+            fd = self._fds.get(path)
+            if fd is not None:
+                # Another process may have compacted (replaced) or removed the file
+                try:
+                    stale = os.fstat(fd).st_ino != os.stat(path).st_ino
+                except FileNotFoundError:
+                    stale = True
+                if stale:
+                    self._close_fd(path)
+                    fd = None
+            if fd is None:
+                flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+                fd = self._fds[path] = os.open(path, flags, 0o644)
+            
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+    
+    def _unloaded_tail(self, path: str) -> bytes:
+        """Bytes of path past the prefix already loaded into memory.
+        
+        That is the whole file if it was replaced since. Caller holds the
+        exclusive log lock, so no append is half written.
+        """
+        try:
+            with open(path, 'rb') as f:
+                loaded = self._loaded.get(path)
+                st = os.fstat(f.fileno())
+                if loaded is not None and loaded[0] == st.st_ino and loaded[1] <= st.st_size:
+                    f.seek(loaded[1])
+                return f.read()
+        except FileNotFoundError:
+            return b""
+    
+    def _replace_log(self, path: str, tmp_path: str, size: int):
+        """Move a compacted tmp_path over path. Caller holds the exclusive log lock."""
+        self._close_fd(path)  # Reopened on the next append
+        os.replace(tmp_path, path)
+        self._loaded[path] = (os.stat(path).st_ino, size)
+    
+    def _close_fd(self, path: str):
+        """Close the cached descriptor for path, if any. Caller holds _lock."""
+        fd = self._fds.pop(path, None)
+        if fd is not None:
+            os.close(fd)
+    
     def ensure_files_exist(self):
         """Create required files if they don't exist"""
         files = [
@@ -68,23 +349,43 @@ class AgentManager:
     
     def load_agent_data(self):
         """Load existing agent data"""
-        # Load active agents safely
+        # Persist anything still buffered before re-reading the log
+        self.flush()
+        self._todos = None  # Re-read lazily as well
+        
+        # Load active agents safely. agents_file is an append-only log, so
+        # an agent may appear several times; the last record wins.
         self.agents = {}
-        try:
-            with open(self.agents_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    parts = line.split(' ', 1)
-                    if len(parts) != 2:
-                        continue
-                    try:
-                        self.agents[parts[0]] = json.loads(parts[1])
-                    except json.JSONDecodeError as exc:
-                        print(f"[WARN] Skipping malformed agent line: {exc}")
-        except FileNotFoundError:
-            pass
+        self._encoded = {}
+        self._log_records = 0
+        self._loaded.pop(self._agent_log, None)
+        rewrite_binlog = False
+        if self._binlog:
+            try:
+                with open(self.agents_binlog_file, 'rb') as f:
+                    ino = os.fstat(f.fileno()).st_ino
+                    data = f.read()
+                records, intact = _read_frames(data)
+                self._loaded[self.agents_binlog_file] = (ino, intact)
+                for record in records:
+                    self.agents[record["id"]] = record
+                self._log_records = len(records)
+                if intact < len(data):
+                    # Appends after the torn bytes would be unreadable
+                    print("[WARN] Dropping truncated record at end of agent log")
+                    rewrite_binlog = True
+            except FileNotFoundError:
+                # First run with the binary log: start from the JSONL file
+                self._load_agents_jsonl()
+                rewrite_binlog = True
+        else:
+            self._load_agents_jsonl()
+        for agent in self.agents.values():
+            agent["thoughts"] = deque(agent.get("thoughts", ()), maxlen=MAX_THOUGHTS)
+        if rewrite_binlog:
+            with self._lock:
+                self._compact_agents()
+        self._rebuild_indexes()
 
         # Load personalities
         try:
@@ -96,6 +397,34 @@ class AgentManager:
         # Check for stuck spawning agents on startup
         self.unstuck_spawning_agents()
     
+    def _load_agents_jsonl(self):
+        """Read agents_file into self.agents"""
+        try:
+            with open(self.agents_file, 'rb') as f:
+                ino = os.fstat(f.fileno()).st_ino
+                data = f.read()
+            # A line still being appended by another process is not loaded
+            self._loaded[self.agents_file] = (ino, data.rfind(b"\n") + 1)
+        except FileNotFoundError:
+            data = b""
+        # Bare JSON lines are already in the format compaction writes
+        reuse_lines = not self._binlog
+        for line in data.splitlines():
+            if not line or line.isspace():
+                continue
+            self._log_records += 1
+            try:
+                record = _parse_record(line)
+            except json.JSONDecodeError as exc:
+                print(f"[WARN] Skipping malformed agent line: {exc}")
+                continue
+            if record is not None:
+                self.agents[record["id"]] = record
+                if reuse_lines and line[:1] == b'{':
+                    self._encoded[record["id"]] = line + b"\n"
+                else:
+                    self._encoded.pop(record["id"], None)
+    
     def create_default_personalities(self):
         """Create default agent personalities"""
         personalities = {
@@ -157,25 +486,36 @@ class AgentManager:
     def spawn_agent(self, personality: AgentPersonality, task_id: Optional[str] = None) -> str:
         """Spawn a new agent with specified personality"""
         agent_id = f"{personality.value}_{int(time.time())}"
+        now = datetime.now()
+        now_iso = now.isoformat()
         
-        agent_data = {
+        agent_data: Dict[str, Any] = {
             "id": agent_id,
             "personality": personality.value,
             "status": AgentStatus.SPAWNING.value,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "created_at": now_iso,
+            "updated_at": now_iso,
             "current_task": task_id,
             "completed_tasks": [],
             "active_session_id": None,
             "process_id": None,
-            "thoughts": [],
+            "thoughts": deque(maxlen=MAX_THOUGHTS),
             "metrics": {
                 "tasks_completed": 0,
+                "successes": 0,
                 "time_spent": 0,
                 "success_rate": 0
             }
         }
         
+        with self._index_lock:
+            # Ids only have one-second resolution; replace a same-second twin
+            previous = self.agents.get(agent_id)
+            if previous is not None:
+                self._unindex(previous)
+            self._index(agent_data)
+            self._spawning[agent_id] = now.timestamp()
+        
         # Save to file
         self.save_agent(agent_id, agent_data)
         
@@ -185,23 +525,277 @@ class AgentManager:
         print(f"   Task: {task_id or 'No task assigned'}")
         
         # Auto-transition to IDLE after a short delay to simulate agent startup
-        def complete_spawning():
-            time.sleep(2)  # Simulate startup time
-            self.update_agent_status(agent_id, AgentStatus.IDLE, "Agent startup completed successfully")
-        
-        # Run in background thread
-        threading.Thread(target=complete_spawning, daemon=True).start()
+        with self._timer_cv:
+            heapq.heappush(self._timers, (time.monotonic() + SPAWN_DELAY, agent_id))
+            if self._timer_thread is None:
+                self._timer_thread = threading.Thread(target=self._timer_loop, name="agent-spawn-timer", daemon=True)
+                self._timer_thread.start()
+            else:
+                self._timer_cv.notify()
         
         return agent_id
     
+    def _timer_loop(self):
+        """Finish spawning agents as their deadlines pass; exit once none are left"""
+        while True:
+            with self._timer_cv:
+                while True:
+                    if not self._timers:
+                        self._timer_thread = None
+                        return
+                    delay = self._timers[0][0] - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._timer_cv.wait(delay)
+                now = time.monotonic()
+                due = []
+                while self._timers and self._timers[0][0] <= now:
+                    due.append(heapq.heappop(self._timers)[1])
+            
+            for agent_id in due:
+                self.update_agent_status(agent_id, AgentStatus.IDLE, "Agent startup completed successfully")
+    
+    def _rebuild_indexes(self):
+        """Recompute the reverse indexes, totals and spawning index from scratch"""
+        with self._index_lock:
+            self._by_status = defaultdict(dict)
+            self._by_personality = defaultdict(dict)
+            self._tasks_completed = 0
+            self._spawning = {}
+            for agent in self.agents.values():
+                if not self._index(agent):
+                    print(f"[WARN] Not indexing malformed agent record: {agent['id']}")
+                    continue
+                if agent.get("status") == AgentStatus.SPAWNING.value:
+                    try:
+                        created = datetime.fromisoformat(agent["created_at"]).timestamp()
+                    except (KeyError, TypeError, ValueError):
+                        continue  # No usable spawn time; never auto-promoted
+                    self._spawning[agent["id"]] = created
+    
+    @staticmethod
+    def _index_fields(agent: Dict) -> Optional[Tuple[str, str, int]]:
+        """(status, personality, tasks completed) for the indexes, or None.
+        
+        Hand-edited or older records may lack fields; missing ones fall back
+        to "unknown" and 0, and records with unusable values are not indexed.
+        """
+        status = agent.get("status", "unknown")
+        personality = agent.get("personality", "unknown")
+        metrics = agent.get("metrics")
+        completed = metrics.get("tasks_completed", 0) if isinstance(metrics, dict) else 0
+        if not (isinstance(status, str) and isinstance(personality, str) and isinstance(completed, int)):
+            return None
+        return status, personality, completed
+    
+    def _index(self, agent: Dict) -> bool:
+        """Add agent to the reverse indexes and totals. Caller holds _index_lock.
+        
+        Returns False, indexing nothing, for a record _index_fields rejects.
+        """
+        fields = self._index_fields(agent)
+        if fields is None:
+            return False
+        status, personality, completed = fields
+        self._by_status[status][agent["id"]] = None
+        self._by_personality[personality][agent["id"]] = None
+        self._tasks_completed += completed
+        return True
+    
+    def _unindex(self, agent: Dict):
+        """Undo _index for agent. Caller holds _index_lock."""
+        fields = self._index_fields(agent)
+        if fields is None:
+            return
+        status, personality, completed = fields
+        self._by_status[status].pop(agent["id"], None)
+        self._by_personality[personality].pop(agent["id"], None)
+        self._tasks_completed -= completed
+    
+    def _set_status(self, agent: Dict, status: str):
+        """Change agent's status, moving it between the status indexes"""
+        with self._index_lock:
+            self._by_status[agent.get("status", "unknown")].pop(agent["id"], None)
+            self._by_status[status][agent["id"]] = None
+            if status == AgentStatus.SPAWNING.value:
+                if agent.get("status") != status:
+                    self._spawning[agent["id"]] = datetime.fromisoformat(agent["created_at"]).timestamp()
+            else:
+                self._spawning.pop(agent["id"], None)
+            agent["status"] = status
+    
+    def _stripe(self, agent_id: str) -> int:
+        """Index of the lock stripe (and dirty set) owning agent_id"""
+        return hash(agent_id) % LOCK_STRIPES
+    
     def save_agent(self, agent_id: str, agent_data: Dict):
-        """Save agent data to file (thread-safe)."""
-        with self._lock:
+        """Queue agent data to be appended to the agents log (thread-safe).
+        
+        Writes are coalesced by a background flusher; call flush() to force
+        them out immediately. Without write_behind the record is written
+        before this returns. Each public mutator calls this once, after
+        all of its changes; helpers such as _append_thought never save.
+        """
+        stripe = self._stripe(agent_id)
+        with self._stripes[stripe]:
             self.agents[agent_id] = agent_data
-            # Write atomically: build full content then replace file
-            lines = [f"{aid} {json.dumps(data)}\n" for aid, data in self.agents.items()]
-            with open(self.agents_file, 'w') as f:
-                f.writelines(lines)
+            dirty = self._dirty[stripe]
+            dirty.add(agent_id)
+            pending = len(dirty)
+        
+        if not self._write_behind:
+            self._write_dirty()
+            return
+        
+        # Unlocked fast path; _start_flusher re-checks under the condition
+        if self._flusher is None:
+            self._start_flusher()
+        elif pending * LOCK_STRIPES >= FLUSH_MAX_PENDING:
+            with self._flush_cv:
+                self._flush_cv.notify()
+    
+    def _start_flusher(self):
+        """Start the flusher thread unless one is already running"""
+        with self._flush_cv:
+            if self._flusher is None:
+                # Non-daemon so interpreter shutdown waits for the last drain
+                self._flusher = threading.Thread(target=self._flush_loop, name="agent-flusher")
+                self._flusher.start()
+    
+    def flush(self):
+        """Write all buffered agent records to agents_file now."""
+        self._write_dirty()
+    
+    def _flush_loop(self):
+        """Drain the dirty sets until they stay empty, then exit."""
+        try:
+            while True:
+                # Give further saves a chance to coalesce into this write
+                with self._flush_cv:
+                    self._flush_cv.wait(self._flush_interval)
+                written = self._write_dirty()
+                # Back off while busy, tighten up again when traffic is light
+                if written >= FLUSH_MAX_PENDING:
+                    self._flush_interval = min(self._flush_interval * 2, 4 * FLUSH_INTERVAL)
+                elif written <= 1:
+                    self._flush_interval = FLUSH_INTERVAL
+                
+                if not any(self._dirty):
+                    with self._flush_cv:
+                        self._flusher = None
+                    # A save that saw the old thread may have landed meanwhile
+                    if not any(self._dirty):
+                        return
+                    with self._flush_cv:
+                        if self._flusher is not None:
+                            return  # That save already started a new flusher
+                        self._flusher = threading.current_thread()
+        except Exception as exc:
+            # The failed records stay queued for the next flush
+            print(f"[WARN] Agent flusher stopped: {exc!r}", file=sys.stderr)
+        finally:
+            # Let the next save start a new flusher
+            with self._flush_cv:
+                if self._flusher is threading.current_thread():
+                    self._flusher = None
+    
+    def _write_dirty(self) -> int:
+        """Append one record per dirty agent."""
+        # Held across drain and write so concurrent flushes cannot append
+        # an agent's records out of order; savers only take stripe locks
+        with self._lock:
+            pending: List[Tuple[int, str, Dict]] = []
+            for stripe, lock in enumerate(self._stripes):
+                with lock:
+                    dirty = self._dirty[stripe]
+                    if dirty:
+                        for aid in dirty:
+                            data = self.agents.get(aid)
+                            if data is not None:
+                                pending.append((stripe, aid, _snapshot(data)))
+                        dirty.clear()
+            if not pending:
+                return 0
+            
+            try:
+                lines: List[bytes] = []
+                for _, aid, data in pending:
+                    encoded = self._encoded[aid] = self._encode_agent(data)
+                    lines.append(encoded)
+                self._append_bytes(self._agent_log, b"".join(lines))
+            except BaseException:
+                # Requeue so a later flush retries these agents
+                for stripe, aid, _ in pending:
+                    with self._stripes[stripe]:
+                        self._dirty[stripe].add(aid)
+                raise
+            self._log_records += len(lines)
+            # Superseded records pile up; rewrite once they dominate the file
+            if self._log_records > max(64, 4 * len(self.agents)):
+                self._compact_agents()
+        return len(lines)
+    
+    def _encode_agent(self, data: Dict) -> bytes:
+        """Encode one agent record for the agent log"""
+        if self._binlog:
+            return _frame(data)
+        return _dumps(data) + b"\n"
+    
+    def _compact_agents(self):
+        """Rewrite the agent log with one record per agent. Caller holds _lock.
+        
+        Records other processes appended since this manager loaded the log
+        are kept: for their agents they are the latest on disk, so they are
+        written instead of the in-memory copy.
+        """
+        path = self._agent_log
+        with self._log_lock(path, exclusive=True):
+            tail = self._unloaded_tail(path)
+            if self._binlog:
+                for record in _read_frames(tail)[0]:
+                    self._encoded[record["id"]] = _frame(record)
+            else:
+                for line in tail.splitlines():
+                    if not line or line.isspace():
+                        continue
+                    try:
+                        record = _parse_record(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if record is not None:
+                        # Prefixed lines are rewritten in the bare format
+                        self._encoded[record["id"]] = line + b"\n" if line[:1] == b'{' else _dumps(record) + b"\n"
+            
+            tmp_path = path + ".tmp"
+            size = 0
+            with open(tmp_path, 'wb') as f:
+                for agent_id, data in list(self.agents.items()):
+                    encoded = self._encoded.get(agent_id)
+                    if encoded is None:
+                        encoded = self._encoded[agent_id] = self._encode_agent(_snapshot(data))
+                    size += f.write(encoded)
+                # Agents only other processes know about
+                for agent_id, encoded in self._encoded.items():
+                    if agent_id not in self.agents:
+                        size += f.write(encoded)
+            self._replace_log(path, tmp_path, size)
+            self._log_records = len(self._encoded.keys() | self.agents.keys())
+    
+    def export_json(self, path: Optional[str] = None) -> str:
+        """Write every agent as JSONL to path (default: agents_file) and return the path"""
+        self.flush()
+        path = path or self.agents_file
+        if path == self._agent_log:
+            # Writing over the live JSONL log is a compaction; it must keep
+            # other processes' records too
+            with self._lock:
+                self._compact_agents()
+            return path
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.writelines(_dumps(data) + b"\n" for data in list(self.agents.values()))
+        os.replace(tmp_path, path)
+        return path
     
     def assign_task(self, agent_id: str, task_id: str) -> bool:
         """Assign a task to an agent"""
@@ -215,12 +809,13 @@ class AgentManager:
             print(f"ERROR: Agent {agent_id} is not available (status: {agent['status']})")
             return False
         
+        now_iso = datetime.now().isoformat()
         agent["current_task"] = task_id
-        agent["status"] = AgentStatus.WORKING.value
-        agent["updated_at"] = datetime.now().isoformat()
+        self._set_status(agent, AgentStatus.WORKING.value)
+        agent["updated_at"] = now_iso
         
         # Add thought about task assignment
-        self.add_agent_thought(agent_id, f"Assigned new task: {task_id}")
+        self._append_thought(agent, f"Assigned new task: {task_id}", now_iso)
         
         # Create TODO entry for task assignment
         self.create_todo_entry(
@@ -241,15 +836,19 @@ class AgentManager:
         
         agent = self.agents[agent_id]
         old_status = agent["status"]
-        agent["status"] = status.value
-        agent["updated_at"] = datetime.now().isoformat()
+        if old_status == status.value and not thought:
+            return  # Nothing changes, so skip the write
+        
+        now_iso = datetime.now().isoformat()
+        self._set_status(agent, status.value)
+        agent["updated_at"] = now_iso
         
         # Log status change
         if old_status != status.value:
-            self.add_agent_thought(agent_id, f"Status changed: {old_status} -> {status.value}")
+            self._append_thought(agent, f"Status changed: {old_status} -> {status.value}", now_iso)
         
         if thought:
-            self.add_agent_thought(agent_id, thought)
+            self._append_thought(agent, thought, now_iso)
         
         self.save_agent(agent_id, agent)
     
@@ -259,28 +858,31 @@ class AgentManager:
             return
         
         agent = self.agents[agent_id]
-        thought_data = {
-            "timestamp": datetime.now().isoformat(),
-            "thought": thought
-        }
-        
-        agent["thoughts"].append(thought_data)
-        
-        # Keep only last 50 thoughts to prevent memory bloat
-        if len(agent["thoughts"]) > 50:
-            agent["thoughts"] = agent["thoughts"][-50:]
+        # Drop an immediate repeat of the previous thought (keepalive chatter)
+        now = time.monotonic()
+        last_at = self._last_thought_at.get(agent_id)
+        self._last_thought_at[agent_id] = now
+        if (last_at is not None and now - last_at < THOUGHT_DEDUP_WINDOW
+                and agent["thoughts"] and agent["thoughts"][-1]["thought"] == thought):
+            return
         
+        self._append_thought(agent, thought, datetime.now().isoformat())
         self.save_agent(agent_id, agent)
     
+    def _append_thought(self, agent: Dict, thought: str, timestamp: str):
+        """Record a thought on agent without saving it"""
+        # Bounded deque: the oldest thought drops off once MAX_THOUGHTS is hit
+        agent["thoughts"].append({
+            "timestamp": timestamp,
+            "thought": thought
+        })
+    
     def unstuck_spawning_agents(self):
         """Fix agents stuck in spawning state by transitioning them to idle"""
-        stuck_agents = []
-        for agent_id, agent_data in self.agents.items():
-            if agent_data["status"] == AgentStatus.SPAWNING.value:
-                # Check if agent has been spawning for more than 30 seconds
-                created_at = datetime.fromisoformat(agent_data["created_at"])
-                if (datetime.now() - created_at).total_seconds() > 30:
-                    stuck_agents.append(agent_id)
+        # Check for agents that have been spawning for more than 30 seconds
+        now = time.time()
+        stuck_agents = [agent_id for agent_id, spawned_at in list(self._spawning.items())
+                        if now - spawned_at > 30]
         
         for agent_id in stuck_agents:
             self.update_agent_status(agent_id, AgentStatus.IDLE, "Auto-recovered from stuck spawning state")
@@ -290,7 +892,8 @@ class AgentManager:
     
     def create_todo_entry(self, agent_id: str, title: str, description: str, status: str = "pending", task_id: Optional[str] = None) -> str:
         """Create a TODO entry for agent activity"""
-        todo_id = str(uuid.uuid4())
+        todo_id = _uuid7()
+        now_iso = datetime.now().isoformat()
         todo_data = {
             "id": todo_id,
             "agent_id": agent_id,
@@ -298,8 +901,8 @@ class AgentManager:
             "description": description,
             "status": status,
             "priority": "medium",
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "created_at": now_iso,
+            "updated_at": now_iso,
             "task_id": task_id,
             "tags": ["agent", "auto-generated"],
             "metadata": {
@@ -309,57 +912,111 @@ class AgentManager:
         }
         
         # Save to todos file
-        with open(self.todos_file, 'a') as f:
-            f.write(f"{todo_id} {json.dumps(todo_data)}\n")
+        self._append_todo(todo_data)
         
         # Also integrate with OpenCode TODO system if available
-        try:
-            import subprocess
-            import os
+        if self._opencode_enabled:
+            # Create a simplified todo for OpenCode integration
+            opencode_todo = {
+                "content": f"🤖 {agent_id}: {title}",
+                "status": "pending" if status == "pending" else "in_progress" if status == "in_progress" else "completed",
+                "priority": "medium",
+                "id": f"agent-{todo_id}"
+            }
             
-            # Check if we're in the OpenCode environment
-            if os.path.exists("/home/meridian/strat/Stratavore"):
-                # Create a simplified todo for OpenCode integration
-                opencode_todo = {
-                    "content": f"🤖 {agent_id}: {title}",
-                    "status": "pending" if status == "pending" else "in_progress" if status == "in_progress" else "completed",
-                    "priority": "medium",
-                    "id": f"agent-{todo_id}"
-                }
-                
-                # Write to a shared location that OpenCode can access
-                with open("/tmp/opencode_agent_todos.jsonl", 'a') as f:
-                    f.write(json.dumps(opencode_todo) + "\n")
-                    
-        except Exception as e:
-            print(f"Note: OpenCode integration not available: {e}")
+            # Write to a shared location that OpenCode can access
+            try:
+                with self._lock:
+                    if self._opencode_todos is None:
+                        # Line buffered so OpenCode sees each todo right away
+                        self._opencode_todos = open(OPENCODE_TODOS_FILE, 'a', buffering=1)
+                    self._opencode_todos.write(json.dumps(opencode_todo) + "\n")
+            except Exception as e:
+                print(f"Note: OpenCode integration not available: {e}")
         
         return todo_id
     
-    def update_todo_status(self, todo_id: str, status: str, notes: Optional[str] = None):
-        """Update TODO entry status"""
-        # Load existing todos
-        todos = {}
+    def _read_todos(self, needle: Optional[bytes] = None) -> Tuple[Dict[str, Dict], int]:
+        """Read todos_file into an id-keyed dict; the last record per id wins.
+        
+        Lines not containing needle (when given) are skipped unparsed.
+        Also returns the number of records read.
+        """
+        todos: Dict[str, Dict] = {}
+        records = 0
         try:
-            with open(self.todos_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    parts = line.split(' ', 1)
-                    if len(parts) == 2:
-                        try:
-                            todos[parts[0]] = json.loads(parts[1])
-                        except json.JSONDecodeError:
-                            pass
+            with open(self.todos_file, 'rb') as f:
+                ino = os.fstat(f.fileno()).st_ino
+                data = f.read()
         except FileNotFoundError:
-            return
+            return todos, records
+        if needle is None:
+            # A full read is what _todo_index keeps; see _compact_todos
+            self._loaded[self.todos_file] = (ino, data.rfind(b"\n") + 1)
+        for line in data.splitlines():
+            if needle is not None and needle not in line:
+                continue
+            if not line or line.isspace():
+                continue
+            records += 1
+            try:
+                record = _parse_record(line)
+            except json.JSONDecodeError:
+                continue
+            if record is not None:
+                todos[record["id"]] = record
+        return todos, records
+    
+    def _todo_index(self) -> Dict[str, Dict]:
+        """Return the in-memory todo index, loading it on first use"""
+        if self._todos is None:
+            self._todos, self._todo_log_records = self._read_todos()
+        return self._todos
+    
+    def _append_todo(self, todo: Dict):
+        """Append a todo record; a later record for the same id supersedes it"""
+        with self._lock:
+            self._append_bytes(self.todos_file, _dumps(todo) + b"\n")
+            self._todo_log_records += 1
+            if self._todos is not None:
+                self._todos[todo["id"]] = todo
+                if self._todo_log_records > max(64, 4 * len(self._todos)):
+                    self._compact_todos()
+    
+    def _compact_todos(self):
+        """Rewrite todos_file with one record per todo. Caller holds _lock.
         
-        if todo_id not in todos:
+        Todos other processes appended since the index was loaded are
+        merged into it first, so the rewrite keeps them.
+        """
+        assert self._todos is not None
+        path = self.todos_file
+        with self._log_lock(path, exclusive=True):
+            for line in self._unloaded_tail(path).splitlines():
+                if not line or line.isspace():
+                    continue
+                try:
+                    record = _parse_record(line)
+                except json.JSONDecodeError:
+                    continue
+                if record is not None:
+                    self._todos[record["id"]] = record
+            
+            tmp_path = path + ".tmp"
+            size = 0
+            with open(tmp_path, 'wb') as f:
+                for todo in self._todos.values():
+                    size += f.write(_dumps(todo) + b"\n")
+            self._replace_log(path, tmp_path, size)
+            self._todo_log_records = len(self._todos)
+    
+    def update_todo_status(self, todo_id: str, status: str, notes: Optional[str] = None):
+        """Update TODO entry status"""
+        todo = self._todo_index().get(todo_id)
+        if todo is None:
             return
         
         # Update todo
-        todo = todos[todo_id]
         todo["status"] = status
         todo["updated_at"] = datetime.now().isoformat()
         if notes:
@@ -367,35 +1024,29 @@ class AgentManager:
                 todo["metadata"] = {}
             todo["metadata"]["completion_notes"] = notes
         
-        # Save back to file
-        with open(self.todos_file, 'w') as f:
-            for tid, tdata in todos.items():
-                f.write(f"{tid} {json.dumps(tdata)}\n")
+        # Append the new version rather than rewriting the file
+        self._append_todo(todo)
     
-    def get_agent_todos(self, agent_id: Optional[str] = None) -> List[Dict]:
-        """Get TODO entries, filtered by agent if specified"""
-        todos = []
-        try:
-            with open(self.todos_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    parts = line.split(' ', 1)
-                    if len(parts) != 2:
-                        continue
-                    try:
-                        todo = json.loads(parts[1])
-                        if agent_id is None or todo.get("agent_id") == agent_id:
-                            todos.append(todo)
-                    except json.JSONDecodeError:
-                        pass
-        except FileNotFoundError:
-            pass
+    def get_agent_todos(self, agent_id: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+        """Get TODO entries, newest first, filtered by agent if specified"""
+        # Rows that cannot mention the agent are skipped before parsing;
+        # the post-parse check weeds out substring false positives. Only
+        # ids that JSON writes verbatim can be matched on the raw bytes.
+        needle = None
+        if (agent_id is not None and agent_id.isascii() and agent_id.isprintable()
+                and '"' not in agent_id and '\\' not in agent_id):
+            needle = agent_id.encode('ascii')
         
-        # Sort by created_at descending
-        todos.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-        return todos
+        if self._todos is None and needle is not None:
+            # Not indexed yet: stream the file, parsing only candidate rows
+            candidates = self._read_todos(needle)[0]
+        else:
+            candidates = self._todo_index()
+        # Todos are indexed in the order they were first logged, which is
+        # creation order, so newest first is just that order reversed
+        todos = (todo for todo in reversed(candidates.values())
+                 if agent_id is None or todo.get("agent_id") == agent_id)
+        return list(itertools.islice(todos, limit))
     
     def complete_task(self, agent_id: str, success: bool = True, notes: str = ""):
         """Mark agent's current task as completed"""
@@ -404,24 +1055,30 @@ class AgentManager:
         
         agent = self.agents[agent_id]
         task_id = agent.get("current_task")
+        now_iso = datetime.now().isoformat()
         
         if task_id:
             agent["completed_tasks"].append({
                 "task_id": task_id,
-                "completed_at": datetime.now().isoformat(),
+                "completed_at": now_iso,
                 "success": success,
                 "notes": notes
             })
             
-            # Update metrics
-            agent["metrics"]["tasks_completed"] += 1
+            # Update metrics. The rate is derived from exact counts so it
+            # does not drift, and failures now lower it too.
+            metrics = agent["metrics"]
+            if "successes" not in metrics:
+                # Older records only kept the rate; recover the count from it
+                metrics["successes"] = round(metrics.get("success_rate", 0) * metrics["tasks_completed"] / 100)
+            metrics["tasks_completed"] += 1
             if success:
-                agent["metrics"]["success_rate"] = (
-                    (agent["metrics"]["success_rate"] * (agent["metrics"]["tasks_completed"] - 1) + 100) /
-                    agent["metrics"]["tasks_completed"]
-                )
+                metrics["successes"] += 1
+            metrics["success_rate"] = 100 * metrics["successes"] / metrics["tasks_completed"]
+            with self._index_lock:
+                self._tasks_completed += 1
             
-            self.add_agent_thought(agent_id, f"Completed task {task_id}: {'SUCCESS' if success else 'FAILED'}")
+            self._append_thought(agent, f"Completed task {task_id}: {'SUCCESS' if success else 'FAILED'}", now_iso)
             
             # Create TODO entry for task completion
             todo_title = f"Task Completed: {task_id}" if success else f"Task Failed: {task_id}"
@@ -435,8 +1092,8 @@ class AgentManager:
             )
         
         agent["current_task"] = None
-        agent["status"] = AgentStatus.IDLE.value
-        agent["updated_at"] = datetime.now().isoformat()
+        self._set_status(agent, AgentStatus.IDLE.value)
+        agent["updated_at"] = now_iso
         
         self.save_agent(agent_id, agent)
         
@@ -446,49 +1103,111 @@ class AgentManager:
     
     def get_available_agents(self, personality: Optional[AgentPersonality] = None) -> List[str]:
         """Get list of available agents (idle or completed)"""
-        available = []
-        
-        for agent_id, agent_data in self.agents.items():
-            if agent_data["status"] in [AgentStatus.IDLE.value, AgentStatus.COMPLETED.value]:
-                if personality is None or agent_data["personality"] == personality.value:
-                    available.append(agent_id)
-        
-        return available
+        with self._index_lock:
+            idle = self._by_status[AgentStatus.IDLE.value]
+            completed = self._by_status[AgentStatus.COMPLETED.value]
+            if personality is None:
+                return [*idle, *completed]
+            return [agent_id for agent_id in self._by_personality[personality.value]
+                    if agent_id in idle or agent_id in completed]
+    
+    def get_agents_by_personality(self, personality: AgentPersonality) -> List[str]:
+        """Get ids of all agents with the given personality"""
+        with self._index_lock:
+            return list(self._by_personality[personality.value])
     
     def get_agent_summary(self) -> Dict:
         """Get summary of all agents"""
-        summary = {
-            "total_agents": len(self.agents),
-            "by_status": {},
-            "by_personality": {},
-            "working_agents": 0,
-            "idle_agents": 0,
-            "total_tasks_completed": 0
-        }
-        
-        for agent_data in self.agents.values():
-            # Count by status
-            status = agent_data["status"]
-            summary["by_status"][status] = summary["by_status"].get(status, 0) + 1
-            
-            # Count by personality
-            personality = agent_data["personality"]
-            summary["by_personality"][personality] = summary["by_personality"].get(personality, 0) + 1
-            
-            # Count working/idle
-            if status == AgentStatus.WORKING.value:
-                summary["working_agents"] += 1
-            elif status in [AgentStatus.IDLE.value, AgentStatus.COMPLETED.value]:
-                summary["idle_agents"] += 1
-            
-            # Total tasks completed
-            summary["total_tasks_completed"] += agent_data["metrics"]["tasks_completed"]
+        with self._index_lock:
+            by_status = self._by_status
+            summary: Dict[str, Any] = {
+                "total_agents": len(self.agents),
+                # Statuses every agent has since left linger as empty indexes
+                "by_status": {status: len(ids) for status, ids in by_status.items() if ids},
+                "by_personality": {p: len(ids) for p, ids in self._by_personality.items() if ids},
+                "working_agents": len(by_status[AgentStatus.WORKING.value]),
+                "idle_agents": len(by_status[AgentStatus.IDLE.value]) + len(by_status[AgentStatus.COMPLETED.value]),
+                "total_tasks_completed": self._tasks_completed
+            }
         
         return summary
 
-def main():
+def handle_daemon_request(manager: AgentManager, conn: socket.socket):
+    """Run one {"cmd": ..., "args": [...]} request and send back its output"""
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        try:
+            request = json.loads(conn.makefile('r', encoding='utf-8').readline())
+            command = request["cmd"]
+            if command == "daemon":
+                print("ERROR: Daemon is already running")
+            elif command == "batch":
+                # Would read the daemon's own stdin; callers send one request per command
+                print("ERROR: batch is not supported over the daemon")
+            else:
+                # Pick up writes made by other processes since the last request
+                manager.load_agent_data()
+                main(["agent_manager.py", command, *request.get("args", [])], manager)
+        except (json.JSONDecodeError, KeyError, TypeError) as exc:
+            print(f"ERROR: Malformed daemon request: {exc}")
+        except Exception as exc:
+            print(f"ERROR: {exc}")
+    conn.sendall((buf.getvalue() + DAEMON_SENTINEL).encode('utf-8'))
+
+def serve_daemon(manager: AgentManager):
+    """Serve CLI commands over a Unix socket so callers skip interpreter startup"""
+    if not hasattr(socket, "AF_UNIX"):
+        print("ERROR: Daemon mode requires Unix domain sockets")
+        return
+    
+    if os.path.exists(DAEMON_SOCKET):
+        os.unlink(DAEMON_SOCKET)
+    
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(DAEMON_SOCKET)
+    server.listen()
+    with open(DAEMON_PID_FILE, 'w') as f:
+        f.write(str(os.getpid()))
+    print(f"Agent daemon listening on {DAEMON_SOCKET} (pid {os.getpid()})")
+    
+    # Turn SIGTERM into a normal exit so the socket and pidfile get removed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                handle_daemon_request(manager, conn)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        manager.flush()
+        server.close()
+        for path in (DAEMON_SOCKET, DAEMON_PID_FILE):
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+def run_batch(manager: AgentManager, stream):
+    """Run newline-separated commands from stream against one manager"""
+    for raw in stream:
+        line = raw.strip()
+        if not line or line.startswith('#'):
+            continue
+        try:
+            argv = shlex.split(line)
+        except ValueError as exc:
+            print(f"ERROR: Could not parse batch line {line!r}: {exc}")
+            continue
+        if argv[0] in ("batch", "daemon"):
+            print(f"ERROR: {argv[0]} cannot be used inside a batch")
+            continue
+        main(["agent_manager.py", *argv], manager)
+
+def main(argv: Optional[List[str]] = None, manager: Optional[AgentManager] = None):
     """CLI interface for agent management"""
-    if len(sys.argv) < 2:
+    argv = sys.argv if argv is None else argv
+    if len(argv) < 2:
         print("Usage: python3 agent_manager.py [command]")
         print("Commands:")
         print("  spawn <personality> [task_id]              - Spawn new agent")
@@ -499,39 +1218,41 @@ def main():
         print("  available [personality]                      - List available agents")
         print("  summary                                      - Show agent summary")
         print("  personalities                                - Show available personalities")
+        print("  export-json [path]                           - Write all agents as JSONL")
+        print("  batch                                        - Run newline-separated commands from stdin")
+        print("  daemon                                       - Serve commands over a Unix socket")
         return
     
-    manager = AgentManager()
-    command = sys.argv[1]
+    if manager is None:
+        manager = AgentManager()
+    command = argv[1]
     
     if command == "spawn":
-        if len(sys.argv) < 3:
+        if len(argv) < 3:
             print("Usage: python3 agent_manager.py spawn <personality> [task_id]")
             return
         
-        personality_str = sys.argv[2]
-        task_id = sys.argv[3] if len(sys.argv) > 3 else None
+        personality_str = argv[2]
+        task_id = argv[3] if len(argv) > 3 else None
         
-        try:
-            personality_enum = AgentPersonality(personality_str.lower())
-            agent_id = manager.spawn_agent(personality_enum, task_id)
-            print(f"SUCCESS: Spawned agent: {agent_id}")
-        except ValueError:
+        spawn_personality = _PERSONALITY_BY_VALUE.get(personality_str.lower())
+        if spawn_personality is None:
             print(f"ERROR: Invalid personality: {personality_str}")
             print(f"Available personalities: {[p.value for p in AgentPersonality]}")
+        else:
+            agent_id = manager.spawn_agent(spawn_personality, task_id)
+            print(f"SUCCESS: Spawned agent: {agent_id}")
     
     elif command == "list":
-        personality_filter = sys.argv[2] if len(sys.argv) > 2 else None
+        personality_filter = argv[2] if len(argv) > 2 else None
         
         if personality_filter:
-            try:
-                personality_enum = AgentPersonality(personality_filter.lower())
-                agents = [aid for aid, data in manager.agents.items() 
-                          if data["personality"] == personality_enum.value]
-                print(f"{personality_filter} agents ({len(agents)}):")
-            except ValueError:
+            list_personality = _PERSONALITY_BY_VALUE.get(personality_filter.lower())
+            if list_personality is None:
                 print(f"ERROR: Invalid personality: {personality_filter}")
                 return
+            agents = manager.get_agents_by_personality(list_personality)
+            print(f"{personality_filter} agents ({len(agents)}):")
         else:
             agents = list(manager.agents.keys())
             print(f"All agents ({len(agents)}):")
@@ -551,21 +1272,21 @@ def main():
                 print(f"      Task: {agent['current_task']}")
     
     elif command == "available":
-        personality_filter_str = sys.argv[2] if len(sys.argv) > 2 else None
+        personality_filter_str = argv[2] if len(argv) > 2 else None
         
-        try:
-            personality_filter = AgentPersonality(personality_filter_str.lower()) if personality_filter_str else None
-            available = manager.get_available_agents(personality_filter)
-            
-            if available:
-                print(f"Available agents ({len(available)}):")
-                for agent_id in available:
-                    agent = manager.agents[agent_id]
-                    print(f"  {agent_id} ({agent['personality']})")
-            else:
-                print("No available agents")
-        except ValueError:
+        available_filter = _PERSONALITY_BY_VALUE.get(personality_filter_str.lower()) if personality_filter_str else None
+        if personality_filter_str and available_filter is None:
             print(f"ERROR: Invalid personality: {personality_filter_str}")
+            return
+        available = manager.get_available_agents(available_filter)
+        
+        if available:
+            print(f"Available agents ({len(available)}):")
+            for agent_id in available:
+                agent = manager.agents[agent_id]
+                print(f"  {agent_id} ({agent['personality']})")
+        else:
+            print("No available agents")
     
     elif command == "summary":
         summary = manager.get_agent_summary()
@@ -595,12 +1316,12 @@ def main():
             print()
     
     elif command == "assign":
-        if len(sys.argv) < 4:
+        if len(argv) < 4:
             print("Usage: python3 agent_manager.py assign <agent_id> <task_id>")
             return
         
-        agent_id = sys.argv[2]
-        task_id = sys.argv[3]
+        agent_id = argv[2]
+        task_id = argv[3]
         
         if manager.assign_task(agent_id, task_id):
             print(f"SUCCESS: Assigned task {task_id} to agent {agent_id}")
@@ -608,32 +1329,32 @@ def main():
             print(f"ERROR: Failed to assign task")
     
     elif command == "status":
-        if len(sys.argv) < 4:
+        if len(argv) < 4:
             print("Usage: python3 agent_manager.py status <agent_id> <status> [thought]")
             return
         
-        agent_id = sys.argv[2]
-        status_str = sys.argv[3]
-        thought = sys.argv[4] if len(sys.argv) > 4 else None
+        agent_id = argv[2]
+        status_str = argv[3]
+        thought = argv[4] if len(argv) > 4 else None
         
-        try:
-            status_enum = AgentStatus(status_str.lower())
+        status_enum = _STATUS_BY_VALUE.get(status_str.lower())
+        if status_enum is None:
+            print(f"ERROR: Invalid status: {status_str}")
+            print(f"Available statuses: {[s.value for s in AgentStatus]}")
+        else:
             manager.update_agent_status(agent_id, status_enum, thought)
             print(f"SUCCESS: Updated {agent_id} status to {status_str}")
             if thought:
                 print(f"Thought: {thought}")
-        except ValueError:
-            print(f"ERROR: Invalid status: {status_str}")
-            print(f"Available statuses: {[s.value for s in AgentStatus]}")
     
     elif command == "complete":
-        if len(sys.argv) < 3:
+        if len(argv) < 3:
             print("Usage: python3 agent_manager.py complete <agent_id> [success] [notes]")
             return
         
-        agent_id = sys.argv[2]
-        success = True if len(sys.argv) < 4 else sys.argv[3].lower() == 'true'
-        notes = sys.argv[4] if len(sys.argv) > 4 else ""
+        agent_id = argv[2]
+        success = True if len(argv) < 4 else argv[3].lower() == 'true'
+        notes = argv[4] if len(argv) > 4 else ""
         
         if manager.complete_task(agent_id, success, notes):
             result = "SUCCESS" if success else "FAILED"
@@ -641,6 +1362,16 @@ def main():
         else:
             print(f"ERROR: Failed to complete task for agent {agent_id}")
     
+    elif command == "export-json":
+        path = manager.export_json(argv[2] if len(argv) > 2 else None)
+        print(f"SUCCESS: Exported {len(manager.agents)} agents to {path}")
+    
+    elif command == "batch":
+        run_batch(manager, sys.stdin)
+    
+    elif command == "daemon":
+        serve_daemon(manager)
+    
     elif command == "unstuck-spawning":
         stuck_agents = manager.unstuck_spawning_agents()
         if stuck_agents:
@@ -4,70 +4,242 @@ Job Management System Scripts
 Validation, analysis, and automation for Stratavore job tracking
 """
 
+import heapq
 import json
 import sys
 import os
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Set
+from typing import Any, BinaryIO, Dict, List, Sequence, Set, Tuple
+
+try:
+    import orjson  # Optional; several times faster than the stdlib codec
+    _HAVE_ORJSON = True
+except ImportError:
+    _HAVE_ORJSON = False
+
+def _loads(data: bytes) -> Any:
+    """Parse one JSON line; raises json.JSONDecodeError on bad input"""
+    if _HAVE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _open_sequential(path: str) -> BinaryIO:
+    """Open path for one front-to-back binary read, asking the OS to read ahead"""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_SEQUENTIAL", 0))
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass  # Purely advisory
+    return open(fd, 'rb')
+
+# Fields drawn from a small set of values; interned so every job shares one
+# string object per value
+_INTERNED_FIELDS = ('status', 'priority', 'assignee')
+
+def _intern_fields(record: Any) -> Any:
+    if isinstance(record, dict):
+        for field in _INTERNED_FIELDS:
+            value = record.get(field)
+            if type(value) is str:
+                record[field] = sys.intern(value)
+    return record
+
+JOBS_FILE = 'jobs/jobs.jsonl'
+
+# Rank used when ordering jobs by priority; unknown priorities sort last
+PRIORITY_ORDER = {'high': 0, 'medium': 1, 'low': 2}
+OTHER_PRIORITY = len(PRIORITY_ORDER)
+
+# Integer codes for Job.status; any other status maps to OTHER_STATUS
+PENDING, IN_PROGRESS, COMPLETED, CANCELLED, OTHER_STATUS = range(5)
+STATUS_CODES = {'pending': PENDING, 'in_progress': IN_PROGRESS, 'completed': COMPLETED, 'cancelled': CANCELLED}
+
+# Job.assignee for jobs with a missing, null or empty assignee
+UNASSIGNED = 'unassigned'
+
+def _priority_rank(job: Dict) -> int:
+    return PRIORITY_ORDER.get(job.get('priority', 'low'), OTHER_PRIORITY)
+
+@dataclass(frozen=True, slots=True)
+class Job:
+    """The fields the analysis commands read, decoded once per load.
+    
+    record is the original jobs.jsonl object, for display-only fields.
+    """
+    id: str
+    status: int
+    priority: int
+    assignee: str  # UNASSIGNED when the job has no assignee
+    dependencies: Tuple[str, ...]
+    record: Dict
+    
+    @classmethod
+    def from_record(cls, record: Dict) -> 'Job':
+        return cls(
+            id=record['id'],
+            status=STATUS_CODES.get(record['status'], OTHER_STATUS),
+            priority=_priority_rank(record),
+            assignee=record.get('assignee') or UNASSIGNED,
+            dependencies=tuple(record.get('dependencies') or ()),
+            record=record,
+        )
+
+# Parsed jobs plus the (inode, mtime_ns, size) of the file they came from,
+# so the commands run by "all" share a single parse
+_JOBS_CACHE: Dict[str, Any] = {"stat": None, "data": None, "table": None}
+
+def _stat_key(st: os.stat_result) -> Tuple[int, int, int]:
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+def invalidate_jobs_cache():
+    """Forget the cached jobs; call after writing jobs.jsonl in-process"""
+    _JOBS_CACHE["stat"] = None
+    _JOBS_CACHE["data"] = None
+    _JOBS_CACHE["table"] = None
 
 def load_jobs() -> List[Dict]:
-    """Load all jobs from JSONL file"""
+    """Load all jobs from JSONL file.
+    
+    The parsed list is cached until the file changes; do not mutate it.
+    """
+    try:
+        key = _stat_key(os.stat(JOBS_FILE))
+    except FileNotFoundError:
+        print("❌ jobs.jsonl not found")
+        return []
+    if _JOBS_CACHE["stat"] == key:
+        return _JOBS_CACHE["data"]
+    
     jobs = []
     try:
-        with open('jobs/jobs.jsonl', 'r') as f:
+        with _open_sequential(JOBS_FILE) as f:
             for line in f:
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    jobs.append(json.loads(line))
+                    jobs.append(_intern_fields(_loads(line)))
                 except json.JSONDecodeError as exc:
                     print(f"[WARN] Skipping malformed job line: {exc}")
     except FileNotFoundError:
         print("❌ jobs.jsonl not found")
+        return jobs
+    _JOBS_CACHE["stat"] = key
+    _JOBS_CACHE["data"] = jobs
+    _JOBS_CACHE["table"] = None
     return jobs
 
+def load_job_table() -> List[Job]:
+    """Like load_jobs, but as Job views; cached alongside the parsed jobs"""
+    jobs = load_jobs()
+    table = _JOBS_CACHE["table"]
+    if table is None or _JOBS_CACHE["data"] is not jobs:
+        table = [Job.from_record(job) for job in jobs]
+        if _JOBS_CACHE["data"] is jobs:
+            _JOBS_CACHE["table"] = table
+    return table
+
+def _strongly_connected_components(deps: Dict[str, Sequence[str]]) -> List[List[str]]:
+    """Tarjan's algorithm, iterative so deep chains cannot hit the recursion limit.
+    
+    Edges to ids missing from deps are ignored.
+    """
+    index_of: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    stack: List[str] = []
+    sccs: List[List[str]] = []
+    
+    for root in deps:
+        if root in index_of:
+            continue
+        index_of[root] = lowlink[root] = len(index_of)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, 0)]  # (node, index of the next dependency to visit)
+        while work:
+            node, i = work[-1]
+            children = deps[node]
+            if i < len(children):
+                work[-1] = (node, i + 1)
+                child = children[i]
+                if child not in deps:
+                    continue
+                if child not in index_of:
+                    index_of[child] = lowlink[child] = len(index_of)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, 0))
+                elif child in on_stack:
+                    lowlink[node] = min(lowlink[node], index_of[child])
+                continue
+            
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index_of[node]:
+                scc = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    scc.append(member)
+                    if member == node:
+                        break
+                sccs.append(scc)
+    return sccs
+
+def _cycle_through(start: str, members: Set[str], deps: Dict[str, Sequence[str]]) -> List[str]:
+    """Shortest dependency path from start back to itself within members"""
+    came_from: Dict[str, str] = {}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for dep in deps[node]:
+            if dep == start:
+                path = [node]
+                while path[-1] != start:
+                    path.append(came_from[path[-1]])
+                return path[::-1] + [start]
+            if dep in members and dep not in came_from:
+                came_from[dep] = node
+                queue.append(dep)
+    return [start]
+
 def validate_dependencies() -> bool:
     """Validate job dependencies and check for circular dependencies"""
-    jobs = load_jobs()
+    jobs = load_job_table()
     if not jobs:
         return True
     
     # Build dependency graph
-    deps = {}
+    deps: Dict[str, Sequence[str]] = {}
     for job in jobs:
-        job_id = job['id']
-        deps[job_id] = job.get('dependencies', [])
-    
-    # Check for circular dependencies
-    def visit(job_id: str, visited: Set[str], path: List[str]) -> bool:
-        if job_id in visited:
-            print(f"❌ Circular dependency detected: {' → '.join(path)} → {job_id}")
-            return False
-        if job_id not in deps:
-            return True
-        
-        visited.add(job_id)
-        path.append(job_id)
-        
-        for dep in deps[job_id]:
-            if not visit(dep, visited.copy(), path.copy()):
-                return False
-        
-        return True
+        deps[job.id] = job.dependencies
     
+    # Check for circular dependencies: every strongly connected component
+    # with more than one job, or a job depending on itself, is a cycle.
+    # Each is reported once, starting from its earliest job in the file.
     print("🔍 Validating job dependencies...")
     valid = True
-    for job_id in deps:
-        if not visit(job_id, set(), []):
-            valid = False
+    order = {job_id: i for i, job_id in enumerate(deps)}
+    cycles = [sorted(scc, key=order.__getitem__) for scc in _strongly_connected_components(deps)
+              if len(scc) > 1 or scc[0] in deps[scc[0]]]
+    cycles.sort(key=lambda scc: order[scc[0]])
+    for scc in cycles:
+        path = _cycle_through(scc[0], set(scc), deps)
+        print(f"❌ Circular dependency detected: {' → '.join(path)}")
+        valid = False
     
     if valid:
         print("✅ No circular dependencies found")
     
     # Check for missing dependencies
     print("\n🔍 Checking for missing dependencies...")
-    all_job_ids = set(job['id'] for job in jobs)
+    all_job_ids = set(job.id for job in jobs)
     missing_deps = []
     for job_id, job_deps in deps.items():
         for dep in job_deps:
@@ -86,105 +258,96 @@ def validate_dependencies() -> bool:
 
 def show_job_summary():
     """Show summary of current job status"""
-    jobs = load_jobs()
+    jobs = load_job_table()
     if not jobs:
         print("❌ No jobs found")
         return
     
+    # One pass gathers the status, active-priority and per-agent tallies,
+    # indexed by the Job status and priority codes
+    status_counts = [0] * (OTHER_STATUS + 1)
+    priority_counts = [0] * (OTHER_PRIORITY + 1)  # Excluding completed jobs
+    agent_stats: Dict[str, List[int]] = defaultdict(lambda: [0, 0])  # [active, completed]
+    for job in jobs:
+        status = job.status
+        status_counts[status] += 1
+        stats = agent_stats[job.assignee]
+        if status == COMPLETED:
+            stats[1] += 1
+        else:
+            priority_counts[job.priority] += 1
+            if status == IN_PROGRESS:
+                stats[0] += 1
+    
     print(f"\n📊 JOB SUMMARY ({len(jobs)} total jobs)")
     print("=" * 50)
     
-    # Status breakdown
-    status_counts = {}
-    for job in jobs:
-        status = job['status']
-        status_counts[status] = status_counts.get(status, 0) + 1
-    
-    print(f"🟡 Pending: {status_counts.get('pending', 0)}")
-    print(f"🟠 In Progress: {status_counts.get('in_progress', 0)}")
-    print(f"🟢 Completed: {status_counts.get('completed', 0)}")
-    print(f"🔴 Cancelled: {status_counts.get('cancelled', 0)}")
+    print(f"🟡 Pending: {status_counts[PENDING]}")
+    print(f"🟠 In Progress: {status_counts[IN_PROGRESS]}")
+    print(f"🟢 Completed: {status_counts[COMPLETED]}")
+    print(f"🔴 Cancelled: {status_counts[CANCELLED]}")
     
     # Priority breakdown (excluding completed)
     print(f"\n🎯 PRIORITY BREAKDOWN (active jobs)")
     print("-" * 30)
-    active_jobs = [j for j in jobs if j['status'] != 'completed']
-    priority_counts = {}
-    for job in active_jobs:
-        priority = job['priority']
-        priority_counts[priority] = priority_counts.get(priority, 0) + 1
-    
-    print(f"🔴 High: {priority_counts.get('high', 0)}")
-    print(f"🟡 Medium: {priority_counts.get('medium', 0)}")
-    print(f"🔵 Low: {priority_counts.get('low', 0)}")
+    print(f"🔴 High: {priority_counts[PRIORITY_ORDER['high']]}")
+    print(f"🟡 Medium: {priority_counts[PRIORITY_ORDER['medium']]}")
+    print(f"🔵 Low: {priority_counts[PRIORITY_ORDER['low']]}")
     
     # Agent workload
     print(f"\n🤖 AGENT WORKLOAD")
     print("-" * 20)
-    agent_stats = {}
-    for job in jobs:
-        agent = job.get('assignee', 'unassigned')
-        if agent not in agent_stats:
-            agent_stats[agent] = {'active': 0, 'completed': 0}
-        
-        if job['status'] == 'completed':
-            agent_stats[agent]['completed'] += 1
-        elif job['status'] == 'in_progress':
-            agent_stats[agent]['active'] += 1
-    
-    for agent, stats in agent_stats.items():
-        print(f"{agent}: {stats['active']} active, {stats['completed']} completed")
+    for agent, (active, completed) in agent_stats.items():
+        print(f"{agent}: {active} active, {completed} completed")
 
 def suggest_next_jobs() -> List[Dict]:
     """Suggest jobs that can be started now (no pending dependencies)"""
-    jobs = load_jobs()
+    jobs = load_job_table()
     if not jobs:
         return []
     
-    # Build dependency map
-    completed_jobs = set(job['id'] for job in jobs if job['status'] == 'completed')
-    in_progress_jobs = set(job['id'] for job in jobs if job['status'] == 'in_progress')
-    pending_jobs = [job for job in jobs if job['status'] == 'pending']
+    # One pass splits out completed ids and pending jobs
+    completed_jobs: Set[str] = set()
+    pending_jobs: List[Job] = []
+    for job in jobs:
+        if job.status == COMPLETED:
+            completed_jobs.add(job.id)
+        elif job.status == PENDING:
+            pending_jobs.append(job)
     
-    ready_jobs = []
-    for job in pending_jobs:
-        deps = job.get('dependencies', [])
-        if all(dep in completed_jobs for dep in deps):
-            ready_jobs.append(job)
+    # A pending job is ready when none of its dependencies is unmet
+    ready_jobs = [job for job in pending_jobs if completed_jobs.issuperset(job.dependencies)]
     
-    # Sort by priority, then by creation date
-    priority_order = {'high': 0, 'medium': 1, 'low': 2}
-    ready_jobs.sort(key=lambda j: (priority_order.get(j.get('priority', 'low'), 3), j.get('created_at') or ''))
+    # Sort by priority, then by creation date (sort evaluates each key once)
+    ready_jobs.sort(key=lambda j: (j.priority, j.record.get('created_at') or ''))
     
-    return ready_jobs
+    return [job.record for job in ready_jobs]
 
 def generate_conflict_resolution() -> List[Dict]:
     """Generate conflict resolution suggestions for job scheduling"""
-    jobs = load_jobs()
+    jobs = load_job_table()
     if not jobs:
         return []
     
     conflicts = []
     
     # Check for agent conflicts (multiple jobs assigned to same agent)
-    agent_assignments = {}
+    agent_assignments: Dict[str, List[Job]] = {}
     for job in jobs:
-        if job['status'] == 'pending' and job.get('assignee'):
-            agent = job['assignee']
-            if agent not in agent_assignments:
-                agent_assignments[agent] = []
-            agent_assignments[agent].append(job)
-    
-    for agent, assigned_jobs in agent_assignments.items():
-        if len(assigned_jobs) > 1:
-            # Sort by priority and suggest focusing on highest priority
-            sorted_jobs = sorted(assigned_jobs, key=lambda j: j['priority'])
+        if job.status == PENDING and job.assignee != UNASSIGNED:
+            agent_assignments.setdefault(job.assignee, []).append(job)
+    
+    for agent, assigned in agent_assignments.items():
+        if len(assigned) > 1:
+            # Suggest focusing on the highest priority job; sorting the
+            # raw strings used to rank "low" above "medium"
+            focus = min(assigned, key=lambda j: j.priority)
             conflicts.append({
                 'type': 'agent_overload',
                 'agent': agent,
-                'conflicts': assigned_jobs,
-                'suggestion': f"Focus on {sorted_jobs[0]['title']} ({sorted_jobs[0]['priority']} priority) first",
-                'jobs_to_reassign': assigned_jobs[1:]  # Lower priority jobs
+                'conflicts': [job.record for job in assigned],
+                'suggestion': f"Focus on {focus.record['title']} ({focus.record['priority']} priority) first",
+                'jobs_to_reassign': [job.record for job in assigned if job is not focus]  # Lower priority jobs
             })
     
     return conflicts
@@ -232,23 +395,19 @@ def show_conflicts():
 
 def auto_assign_jobs():
     """Automatically assign unassigned jobs to agents based on workload"""
-    jobs = load_jobs()
+    jobs = load_job_table()
     if not jobs:
         return
     
-    # Calculate current agent workload
-    agent_workload = {}
+    # Calculate current agent workload and collect unassigned jobs in one pass
+    agent_workload: Counter = Counter()
+    unassigned_jobs = []
     for job in jobs:
-        if job.get('assignee') and job['status'] in ['in_progress', 'pending']:
-            agent = job['assignee']
-            agent_workload[agent] = agent_workload.get(agent, 0) + 1
-    
-    # Find agents with lowest workload
-    min_workload = min(agent_workload.values()) if agent_workload else 0
-    available_agents = [agent for agent, workload in agent_workload.items() if workload == min_workload]
-    
-    # Assign unassigned jobs
-    unassigned_jobs = [job for job in jobs if job['status'] == 'pending' and not job.get('assignee')]
+        if job.status == PENDING or job.status == IN_PROGRESS:
+            if job.assignee != UNASSIGNED:
+                agent_workload[job.assignee] += 1
+            elif job.status == PENDING:
+                unassigned_jobs.append(job.record)
     
     if not unassigned_jobs:
         print("✅ All jobs are assigned")
@@ -257,46 +416,58 @@ def auto_assign_jobs():
     print(f"\n🔄 AUTO-ASSIGNMENT SUGGESTIONS")
     print("=" * 40)
     
+    # Hand each job to the least loaded agent, counting the suggestions made
+    # so far; ties go to the agent seen first
+    candidates = [(workload, order, agent) for order, (agent, workload) in enumerate(agent_workload.items())]
+    heapq.heapify(candidates)
     for job in unassigned_jobs[:5]:  # Show top 5
-        suggested_agent = available_agents[0] if available_agents else "unassigned"
+        if candidates:
+            workload, order, suggested_agent = candidates[0]
+            heapq.heapreplace(candidates, (workload + 1, order, suggested_agent))
+        else:
+            suggested_agent = "unassigned"
         print(f"Job: {job['title']}")
         print(f"  Suggest agent: {suggested_agent}")
         print(f"  Priority: {job['priority']}")
         print()
 
+def run_all_commands():
+    """Run every other CLI command in turn"""
+    for name, command in COMMANDS.items():
+        if name != "all":
+            command()
+
+# CLI command name -> handler, in the order "all" runs them
+COMMANDS = {
+    "validate": validate_dependencies,
+    "summary": show_job_summary,
+    "ready": show_ready_jobs,
+    "conflicts": show_conflicts,
+    "assign": auto_assign_jobs,
+    "all": run_all_commands,
+}
+
+USAGE = """Usage: python3 job_tools.py [command]
+Commands:
+  validate     - Validate job dependencies
+  summary      - Show job summary
+  ready        - Show jobs ready to start
+  conflicts    - Show job conflicts and resolutions
+  assign       - Suggest automatic job assignments
+  all          - Run all commands"""
+
 def main():
     """Main CLI interface"""
     if len(sys.argv) < 2:
-        print("Usage: python3 job_tools.py [command]")
-        print("Commands:")
-        print("  validate     - Validate job dependencies")
-        print("  summary      - Show job summary")
-        print("  ready        - Show jobs ready to start")
-        print("  conflicts    - Show job conflicts and resolutions")
-        print("  assign       - Suggest automatic job assignments")
-        print("  all          - Run all commands")
+        print(USAGE)
         return
     
     command = sys.argv[1]
-    
-    if command == "validate":
-        validate_dependencies()
-    elif command == "summary":
-        show_job_summary()
-    elif command == "ready":
-        show_ready_jobs()
-    elif command == "conflicts":
-        show_conflicts()
-    elif command == "assign":
-        auto_assign_jobs()
-    elif command == "all":
-        validate_dependencies()
-        show_job_summary()
-        show_ready_jobs()
-        show_conflicts()
-        auto_assign_jobs()
-    else:
+    handler = COMMANDS.get(command)
+    if handler is None:
         print(f"❌ Unknown command: {command}")
+        return
+    handler()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,43 +4,136 @@ Granular Time Tracking System
 Track job work sessions with second precision
 """
 
+import atexit
 import json
+import os
 import time
 import sys
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
+
+try:
+    import fcntl  # POSIX only; elsewhere appends and vacuums are not serialized
+except ImportError:
+    fcntl = None  # type: ignore[assignment]
+
+try:
+    import orjson  # Optional; several times faster than the stdlib codec
+    _HAVE_ORJSON = True
+except ImportError:
+    _HAVE_ORJSON = False
+
+# Fields drawn from a small set of values; interned so every session shares
+# one string object per value
+_INTERNED_FIELDS = ('status', 'job_id', 'agent')
+
+# Appended records are held in memory until this many bytes are pending
+APPEND_BUFFER_SIZE = 64 * 1024
+
+# maybe_vacuum compacts logs at least this large once superseded lines
+# outnumber live sessions
+VACUUM_MIN_BYTES = 1024 * 1024
+
+# Stdlib fallback for _dumps_line, configured once rather than per
+# json.dumps call. Like orjson it writes non-ASCII text as raw UTF-8.
+_encode = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+
+def _dumps_line(obj: Any) -> bytes:
+    """Serialize obj as one compact, newline-terminated JSON line"""
+    if _HAVE_ORJSON:
+        # Emitted in the same buffer, saving a concatenation copy
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (_encode(obj) + '\n').encode('utf-8')
+
+def _loads(data: bytes) -> Any:
+    """Parse one JSON line; raises json.JSONDecodeError on bad input"""
+    if _HAVE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _open_sequential(path: str) -> BinaryIO:
+    """Open path for one front-to-back binary read, asking the OS to read ahead"""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_SEQUENTIAL", 0))
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass  # Purely advisory
+    return open(fd, 'rb')
+
+def _scannable(text: str) -> bool:
+    """True if text is encoded as itself inside a JSON string, so it can be
+    matched against raw lines byte for byte"""
+    return text.isascii() and text.isprintable() and '"' not in text and '\\' not in text
 
 class TimeTracker:
     def __init__(self):
         self.sessions_file = "jobs/time_sessions.jsonl"
+        # Latest record per session_id and the (inode, mtime_ns, size) the
+        # file was read at; reused until the file changes underneath us
+        self._cache: Optional[Dict[str, Dict]] = None
+        self._cache_stat: Optional[Tuple[int, int, int]] = None
+        # Lines in the file (and pending) that vacuum() would drop
+        self._superseded = 0
+        # Sessions grouped by job_id, built from the cached mapping above,
+        # with each job's [completed seconds, completed count, active sessions]
+        self._job_index: Optional[Dict[str, List[Dict]]] = None
+        self._job_totals: Dict[str, List[Any]] = {}
+        self._job_index_source: Optional[Dict[str, Dict]] = None
+        # Encoded records not yet written, and the O_APPEND descriptor kept
+        # open between flushes; pending records are written at exit at the latest
+        self._pending: List[bytes] = []
+        self._pending_size = 0
+        self._append_fd: Optional[int] = None
+        # flock()ed around appends (shared) and file replacement (exclusive)
+        # so a vacuum in one process cannot drop another's appended records
+        self._lock_fd: Optional[int] = None
+        # Set once this tracker appends; maybe_vacuum only runs after writes
+        self._appended = False
         self.ensure_file_exists()
+        atexit.register(self.close)
     
-    def ensure_file_exists(self):
-        """Create sessions file if it doesn't exist"""
+    def _stat_key(self) -> Optional[Tuple[int, int, int]]:
         try:
-            with open(self.sessions_file, 'r') as f:
-                pass
+            st = os.stat(self.sessions_file)
         except FileNotFoundError:
-            with open(self.sessions_file, 'w') as f:
-                f.write("")
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+    
+    def ensure_file_exists(self):
+        """Create sessions file if it doesn't exist"""
+        # O_CREAT without O_TRUNC leaves an existing file untouched
+        os.close(os.open(self.sessions_file, os.O_RDONLY | os.O_CREAT, 0o644))
     
     def start_session(self, job_id: str, agent: str, description: str = "") -> str:
         """Start a new work session"""
-        session_id = f"{job_id}_{int(time.time())}"
+        # One clock read so the id, timestamps and ISO strings all agree
+        now_ts = time.time()
+        now_iso = datetime.fromtimestamp(now_ts).isoformat()
+        session_id = f"{job_id}_{int(now_ts)}"
+        # Records are folded by session_id, so a second session started on
+        # the same job within the same second needs a distinct id
+        existing = self._ids_with_prefix(session_id)
+        if session_id in existing:
+            suffix = 2
+            while f"{session_id}_{suffix}" in existing:
+                suffix += 1
+            session_id = f"{session_id}_{suffix}"
         session = {
             "session_id": session_id,
             "job_id": job_id,
             "agent": agent,
             "description": description,
             "status": "active",
-            "start_time": datetime.now().isoformat(),
-            "start_timestamp": time.time(),
+            "start_time": now_iso,
+            "start_timestamp": now_ts,
             "end_time": None,
             "end_timestamp": None,
             "duration_seconds": None,
             "paused_time": 0,
             "pauses": [],
-            "created_at": datetime.now().isoformat()
+            "created_at": now_iso
         }
         
         self.append_session(session)
@@ -49,54 +142,281 @@ class TimeTracker:
     
     def end_session(self, session_id: str, notes: str = "") -> bool:
         """End an active work session"""
-        sessions = self.load_sessions()
+        session = self.get_session(session_id)
+        if session is None or session["status"] != "active":
+            print(f"❌ Active session {session_id} not found")
+            return False
         
-        for i, session in enumerate(sessions):
-            if session["session_id"] == session_id and session["status"] == "active":
-                session["status"] = "completed"
-                session["end_time"] = datetime.now().isoformat()
-                session["end_timestamp"] = time.time()
-                session["duration_seconds"] = session["end_timestamp"] - session["start_timestamp"] - session["paused_time"]
-                session["notes"] = notes
-                
-                sessions[i] = session
-                self.save_sessions(sessions)
-                
-                duration = timedelta(seconds=int(session["duration_seconds"]))
-                print(f"⏹️  Ended session {session_id}")
-                print(f"   Duration: {duration}")
-                return True
-        
-        print(f"❌ Active session {session_id} not found")
-        return False
+        # Append the updated record instead of rewriting the file; it
+        # supersedes the earlier line for this session_id on load
+        session = dict(session)
+        session["status"] = "completed"
+        now_ts = time.time()
+        session["end_time"] = datetime.fromtimestamp(now_ts).isoformat()
+        session["end_timestamp"] = now_ts
+        session["duration_seconds"] = session["end_timestamp"] - session["start_timestamp"] - session["paused_time"]
+        session["notes"] = notes
+        self.append_session(session)
+        
+        duration = timedelta(seconds=int(session["duration_seconds"]))
+        print(f"⏹️  Ended session {session_id}")
+        print(f"   Duration: {duration}")
+        return True
+    
+    @contextmanager
+    def _log_lock(self, exclusive: bool) -> Iterator[None]:
+        """Hold the sessions log lock: shared to append, exclusive to replace"""
+        if fcntl is None:
+            yield
+            return
+        if self._lock_fd is None:
+            self._lock_fd = os.open(self.sessions_file + ".lock",
+                                    os.O_RDWR | os.O_CREAT | getattr(os, "O_CLOEXEC", 0), 0o644)
+        fcntl.flock(self._lock_fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
     
     def append_session(self, session: Dict):
-        """Append a new session to the file"""
-        with open(self.sessions_file, 'a') as f:
-            f.write(json.dumps(session) + '\n')
+        """Append a session record to the file.
+        
+        A record whose session_id is already in the file replaces the
+        earlier one when sessions are loaded.
+        """
+        line = _dumps_line(session)
+        self._appended = True
+        self._pending.append(line)
+        self._pending_size += len(line)
+        if self._cache is not None:
+            # The cache covers pending records too; _session_index flushes
+            # them before it ever re-reads the file
+            if session["session_id"] in self._cache:
+                self._superseded += 1
+            self._cache[session["session_id"]] = session
+        self._job_index = None
+        if self._pending_size >= APPEND_BUFFER_SIZE:
+            self.flush()
+    
+    def flush(self):
+        """Write pending session records to the file"""
+        if not self._pending:
+            return
+        with self._log_lock(exclusive=False):
+            self._write_pending()
+    
+    def _write_pending(self):
+        """flush() without taking the log lock; the caller holds it"""
+        if not self._pending:
+            return
+        cache = self._cache if self._cache_stat == self._stat_key() else None
+        
+        if self._append_fd is not None:
+            # Another process may have vacuumed (replaced) the file
+            try:
+                stale = os.fstat(self._append_fd).st_ino != os.stat(self.sessions_file).st_ino
+            except FileNotFoundError:
+                stale = True
+            if stale:
+                self._close_append_fd()
+        if self._append_fd is None:
+            flags = (os.O_WRONLY | os.O_APPEND | os.O_CREAT
+                     | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0))
+            self._append_fd = os.open(self.sessions_file, flags, 0o644)
+        
+        # O_APPEND puts every write at the current end of file, so trackers
+        # in other processes cannot overwrite each other's records
+        view = memoryview(b''.join(self._pending))
+        while view:
+            view = view[os.write(self._append_fd, view):]
+        self._pending.clear()
+        self._pending_size = 0
+        
+        if cache is not None:
+            self._cache_stat = self._stat_key()
+        else:
+            self._cache = None
+    
+    def close(self):
+        """Flush pending records and close the append descriptor"""
+        self.flush()
+        self._close_append_fd()
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+    
+    def _close_append_fd(self):
+        if self._append_fd is not None:
+            os.close(self._append_fd)
+            self._append_fd = None
+    
+    def _scan_lines(self, needle: bytes):
+        """Yield parsed records from lines containing needle"""
+        self.flush()
+        try:
+            with _open_sequential(self.sessions_file) as f:
+                for line in f:
+                    if needle not in line:
+                        continue
+                    try:
+                        record = _loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(record, dict):
+                        yield record
+        except FileNotFoundError:
+            return
+    
+    def _ids_with_prefix(self, prefix: str) -> Set[str]:
+        """Session ids that start with prefix.
+        
+        Like get_session, this avoids parsing the whole log when the cache
+        is stale.
+        """
+        if (self._cache is not None and self._stat_key() == self._cache_stat) or not _scannable(prefix):
+            return {sid for sid in self._session_index() if sid.startswith(prefix)}
+        
+        ids = set()
+        for record in self._scan_lines(b'"' + prefix.encode('ascii')):
+            sid = record.get("session_id")
+            if isinstance(sid, str) and sid.startswith(prefix):
+                ids.add(sid)
+        return ids
+    
+    def get_session(self, session_id: str) -> Optional[Dict]:
+        """Latest record for session_id, or None.
+        
+        Without a fresh cache this scans the raw lines and parses only the
+        ones that contain the quoted id, instead of the whole log.
+        """
+        if (self._cache is not None and self._stat_key() == self._cache_stat) or not _scannable(session_id):
+            return self._session_index().get(session_id)
+        
+        found = None
+        for record in self._scan_lines(b'"' + session_id.encode('ascii') + b'"'):
+            if record.get("session_id") == session_id:
+                found = record
+        return found
     
     def load_sessions(self) -> List[Dict]:
-        """Load all sessions from file"""
-        sessions = []
+        """Load all sessions from file, in the order they were started"""
+        return list(self._session_index().values())
+    
+    def _session_index(self) -> Dict[str, Dict]:
+        """Map each session_id to its latest record.
+        
+        The mapping is cached until the file changes; do not mutate it or
+        the records in it.
+        """
+        key = self._stat_key()
+        if self._cache is not None and key == self._cache_stat:
+            return self._cache
+        
+        if self._pending:
+            self.flush()
+            key = self._stat_key()
+        sessions: Dict[str, Dict] = {}
+        line_count = 0
         try:
-            with open(self.sessions_file, 'r') as f:
+            with _open_sequential(self.sessions_file) as f:
                 for line in f:
                     line = line.strip()
                     if not line:
                         continue
+                    line_count += 1
                     try:
-                        sessions.append(json.loads(line))
+                        session = _loads(line)
                     except json.JSONDecodeError as exc:
                         print(f"[WARN] Skipping malformed session line: {exc}")
+                        continue
+                    # Same records _scan_lines skips: valid JSON, but not a session
+                    if not isinstance(session, dict) or "session_id" not in session:
+                        print("[WARN] Skipping session line without a session_id")
+                        continue
+                    for field in _INTERNED_FIELDS:
+                        value = session.get(field)
+                        if type(value) is str:
+                            session[field] = sys.intern(value)
+                    sessions[session["session_id"]] = session
         except FileNotFoundError:
-            pass
+            return sessions
+        self._cache = sessions
+        self._cache_stat = key
+        self._superseded = line_count - len(sessions)
         return sessions
     
     def save_sessions(self, sessions: List[Dict]):
-        """Save all sessions back to file"""
-        with open(self.sessions_file, 'w') as f:
-            for session in sessions:
-                f.write(json.dumps(session) + '\n')
+        """Replace the file with exactly the given sessions"""
+        with self._log_lock(exclusive=True):
+            self._replace_sessions(sessions)
+    
+    def _replace_sessions(self, sessions: List[Dict]):
+        """save_sessions() without taking the log lock; the caller holds it"""
+        # Pending records are superseded and the append descriptor would
+        # point at the replaced file
+        self._pending.clear()
+        self._pending_size = 0
+        self._close_append_fd()
+        tmp_file = self.sessions_file + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.writelines(map(_dumps_line, sessions))
+        os.replace(tmp_file, self.sessions_file)
+        self._cache = {session["session_id"]: session for session in sessions}
+        self._cache_stat = self._stat_key()
+        self._superseded = 0
+    
+    def vacuum(self) -> int:
+        """Compact the log to one line per session; returns lines dropped"""
+        # Other trackers cannot append between the read and the replace
+        with self._log_lock(exclusive=True):
+            self._write_pending()
+            sessions = self._session_index()
+            dropped = self._superseded
+            self._replace_sessions(list(sessions.values()))
+        return dropped
+    
+    def maybe_vacuum(self) -> int:
+        """Vacuum a large log once most of its lines are superseded.
+        
+        Only runs after this tracker has appended records, and only parses
+        the log to decide once it is at least VACUUM_MIN_BYTES; smaller logs
+        are never read just to check. Returns lines dropped.
+        """
+        if not self._appended:
+            return 0
+        key = self._stat_key()
+        if key is None or key[2] + self._pending_size < VACUUM_MIN_BYTES:
+            return 0
+        # start/end read through _scan_lines, which leaves no cache behind
+        sessions = self._session_index()
+        if self._superseded <= len(sessions):
+            return 0
+        return self.vacuum()
+    
+    def get_sessions_by_job(self) -> Dict[str, List[Dict]]:
+        """Group all sessions by job_id, keeping start order within each job.
+        
+        Built once per change to the sessions; do not mutate the result.
+        """
+        sessions = self._session_index()
+        if self._job_index is None or self._job_index_source is not sessions:
+            index: Dict[str, List[Dict]] = {}
+            totals: Dict[str, List[Any]] = {}
+            for session in sessions.values():
+                job_id = session["job_id"]
+                index.setdefault(job_id, []).append(session)
+                job_totals = totals.get(job_id)
+                if job_totals is None:
+                    job_totals = totals[job_id] = [0, 0, []]
+                if session["status"] == "completed" and session["duration_seconds"]:
+                    job_totals[0] += session["duration_seconds"]
+                    job_totals[1] += 1
+                elif session["status"] == "active":
+                    job_totals[2].append(session)
+            self._job_index = index
+            self._job_totals = totals
+            self._job_index_source = sessions
+        return self._job_index
     
     def get_active_sessions(self) -> List[Dict]:
         """Get all currently active sessions"""
@@ -105,112 +425,121 @@ class TimeTracker:
     
     def calculate_job_time(self, job_id: str) -> Dict:
         """Calculate total time spent on a job"""
-        sessions = self.get_job_sessions(job_id)
+        self.get_sessions_by_job()
+        completed_seconds, completed_sessions, active = self._job_totals.get(job_id, (0, 0, ()))
         
-        total_seconds = 0
-        completed_sessions = 0
-        
-        for session in sessions:
-            if session["status"] == "completed" and session["duration_seconds"]:
-                total_seconds += session["duration_seconds"]
-                completed_sessions += 1
-            elif session["status"] == "active":
-                # Calculate current session time
-                current_time = time.time() - session["start_timestamp"] - session["paused_time"]
-                total_seconds += current_time
+        # Completed durations are summed once per load; only the running
+        # sessions need the current time
+        total_seconds = completed_seconds
+        now = time.time()
+        for session in active:
+            total_seconds += now - session["start_timestamp"] - session["paused_time"]
         
         return {
             "job_id": job_id,
             "total_seconds": total_seconds,
             "total_hours": total_seconds / 3600,
             "completed_sessions": completed_sessions,
-            "active_sessions": len([s for s in sessions if s["status"] == "active"]),
+            "active_sessions": len(active),
             "formatted_time": str(timedelta(seconds=int(total_seconds)))
         }
     
     def get_job_sessions(self, job_id: str) -> List[Dict]:
         """Get all sessions for a specific job"""
-        sessions = self.load_sessions()
-        return [s for s in sessions if s["job_id"] == job_id]
+        return list(self.get_sessions_by_job().get(job_id, ()))
+
+def _cmd_start(tracker: TimeTracker, args: List[str]):
+    if len(args) < 2:
+        print("Usage: python3 time_tracker.py start <job_id> <agent> [description]")
+        return
+    description = args[2] if len(args) > 2 else ""
+    tracker.start_session(args[0], args[1], description)
+
+def _cmd_end(tracker: TimeTracker, args: List[str]):
+    if len(args) < 1:
+        print("Usage: python3 time_tracker.py end <session_id> [notes]")
+        return
+    notes = args[1] if len(args) > 1 else ""
+    tracker.end_session(args[0], notes)
+
+def _cmd_active(tracker: TimeTracker, args: List[str]):
+    active = tracker.get_active_sessions()
+    if not active:
+        print("📭 No active sessions")
+        return
+    print(f"🔄 {len(active)} active sessions:")
+    now = time.time()
+    for session in active:
+        # The epoch timestamp is stored alongside the ISO string; use it
+        # rather than parsing the string back
+        start_time = datetime.fromtimestamp(session["start_timestamp"])
+        duration = now - session["start_timestamp"]
+        print(f"  {session['session_id']}")
+        print(f"    Job: {session['job_id']}")
+        print(f"    Agent: {session['agent']}")
+        print(f"    Started: {start_time.strftime('%H:%M:%S')}")
+        print(f"    Duration: {str(timedelta(seconds=int(duration)))}")
+        if session.get("description"):
+            print(f"    Note: {session['description']}")
+        print()
+
+def _cmd_job(tracker: TimeTracker, args: List[str]):
+    if len(args) < 1:
+        print("Usage: python3 time_tracker.py job <job_id>")
+        return
+    job_id = args[0]
+    time_info = tracker.calculate_job_time(job_id)
+    print(f"📊 Time Summary for {job_id}")
+    print(f"  Total Time: {time_info['formatted_time']}")
+    print(f"  Hours: {time_info['total_hours']:.2f}")
+    print(f"  Completed Sessions: {time_info['completed_sessions']}")
+    print(f"  Active Sessions: {time_info['active_sessions']}")
+
+def _cmd_all(tracker: TimeTracker, args: List[str]):
+    by_job = tracker.get_sessions_by_job()
+    print(f"📈 ALL SESSIONS ({sum(map(len, by_job.values()))} total)")
+    
+    for job_id in by_job:
+        time_info = tracker.calculate_job_time(job_id)
+        print(f"\n🏷️  {job_id}")
+        print(f"   ⏱️  {time_info['formatted_time']} ({time_info['total_hours']:.2f}h)")
+        print(f"   📋 {time_info['completed_sessions']} completed, {time_info['active_sessions']} active")
+
+def _cmd_vacuum(tracker: TimeTracker, args: List[str]):
+    dropped = tracker.vacuum()
+    print(f"🧹 Compacted {tracker.sessions_file} ({dropped} superseded lines removed)")
+
+# CLI command name -> handler(tracker, remaining argv)
+COMMANDS = {
+    "start": _cmd_start,
+    "end": _cmd_end,
+    "active": _cmd_active,
+    "job": _cmd_job,
+    "all": _cmd_all,
+    "vacuum": _cmd_vacuum,
+}
+
+USAGE = """Usage: python3 time_tracker.py [command]
+Commands:
+  start <job_id> <agent> [description]  - Start work session
+  end <session_id> [notes]            - End work session
+  active                               - Show active sessions
+  job <job_id>                        - Show job time summary
+  all                                  - Show all session stats
+  vacuum                               - Compact ended sessions"""
 
 def main():
     """CLI interface for time tracking"""
     tracker = TimeTracker()
     
     if len(sys.argv) < 2:
-        print("Usage: python3 time_tracker.py [command]")
-        print("Commands:")
-        print("  start <job_id> <agent> [description]  - Start work session")
-        print("  end <session_id> [notes]            - End work session")
-        print("  active                               - Show active sessions")
-        print("  job <job_id>                        - Show job time summary")
-        print("  all                                  - Show all session stats")
+        print(USAGE)
         return
     
-    command = sys.argv[1]
-    
-    if command == "start":
-        if len(sys.argv) < 4:
-            print("Usage: python3 time_tracker.py start <job_id> <agent> [description]")
-            return
-        job_id = sys.argv[2]
-        agent = sys.argv[3]
-        description = sys.argv[4] if len(sys.argv) > 4 else ""
-        tracker.start_session(job_id, agent, description)
-    
-    elif command == "end":
-        if len(sys.argv) < 3:
-            print("Usage: python3 time_tracker.py end <session_id> [notes]")
-            return
-        session_id = sys.argv[2]
-        notes = sys.argv[3] if len(sys.argv) > 3 else ""
-        tracker.end_session(session_id, notes)
-    
-    elif command == "active":
-        active = tracker.get_active_sessions()
-        if not active:
-            print("📭 No active sessions")
-        else:
-            print(f"🔄 {len(active)} active sessions:")
-            for session in active:
-                start_time = datetime.fromisoformat(session["start_time"])
-                duration = time.time() - session["start_timestamp"]
-                print(f"  {session['session_id']}")
-                print(f"    Job: {session['job_id']}")
-                print(f"    Agent: {session['agent']}")
-                print(f"    Started: {start_time.strftime('%H:%M:%S')}")
-                print(f"    Duration: {str(timedelta(seconds=int(duration)))}")
-                if session.get("description"):
-                    print(f"    Note: {session['description']}")
-                print()
-    
-    elif command == "job":
-        if len(sys.argv) < 3:
-            print("Usage: python3 time_tracker.py job <job_id>")
-            return
-        job_id = sys.argv[2]
-        time_info = tracker.calculate_job_time(job_id)
-        print(f"📊 Time Summary for {job_id}")
-        print(f"  Total Time: {time_info['formatted_time']}")
-        print(f"  Hours: {time_info['total_hours']:.2f}")
-        print(f"  Completed Sessions: {time_info['completed_sessions']}")
-        print(f"  Active Sessions: {time_info['active_sessions']}")
-    
-    elif command == "all":
-        sessions = tracker.load_sessions()
-        print(f"📈 ALL SESSIONS ({len(sessions)} total)")
-        
-        # Group by job
-        job_times = {}
-        for session in sessions:
-            job_id = session["job_id"]
-            if job_id not in job_times:
-                job_times[job_id] = tracker.calculate_job_time(job_id)
-        
-        for job_id, time_info in job_times.items():
-            print(f"\n🏷️  {job_id}")
-            print(f"   ⏱️  {time_info['formatted_time']} ({time_info['total_hours']:.2f}h)")
-            print(f"   📋 {time_info['completed_sessions']} completed, {time_info['active_sessions']} active")
+    handler = COMMANDS.get(sys.argv[1])
+    if handler is not None:
+        handler(tracker, sys.argv[2:])
+        tracker.maybe_vacuum()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the agent and todo logs kept by agents/agent_manager.py
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+
+# Add agents directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agents'))
+from agent_manager import AgentManager, AgentPersonality
+
+class AgentManagerTestCase(unittest.TestCase):
+    """Gives each test its own directory of agent files"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.data_dir = tmp.name
+        # Spawn and status changes announce themselves on stdout,
+        # and finishing a spawn would write after the directory is gone
+        for patcher in (patch("builtins.print"), patch("agent_manager.SPAWN_DELAY", 3600)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def manager(self, **kwargs):
+        manager = AgentManager(base_dir=self.data_dir, **kwargs)
+        self.addCleanup(manager.close)
+        return manager
+
+    def read_lines(self, name="active_agents.jsonl"):
+        with open(os.path.join(self.data_dir, name)) as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+class TestWriteThrough(AgentManagerTestCase):
+    """AgentManager(write_behind=False), as used per web request"""
+
+    def test_save_is_on_disk_before_returning(self):
+        manager = self.manager(write_behind=False)
+        agent_id = manager.spawn_agent(AgentPersonality.CADET, "task-1")
+        self.assertIn(agent_id, [record["id"] for record in self.read_lines()])
+
+    def test_no_flusher_thread_is_started(self):
+        manager = self.manager(write_behind=False)
+        manager.spawn_agent(AgentPersonality.CADET)
+        self.assertIsNone(manager._flusher)
+
+    def test_fresh_manager_sees_the_change(self):
+        writer = self.manager(write_behind=False)
+        agent_id = writer.spawn_agent(AgentPersonality.SENIOR, "task-2")
+        reader = self.manager()
+        self.assertEqual(reader.agents[agent_id]["current_task"], "task-2")
+
+def _agent(agent_id, status="idle", task=None):
+    """A minimal agent record as the log stores it"""
+    return {
+        "id": agent_id,
+        "personality": "cadet",
+        "status": status,
+        "created_at": "2025-02-11T10:00:00",
+        "updated_at": "2025-02-11T10:00:00",
+        "current_task": task,
+        "completed_tasks": [],
+        "thoughts": [],
+        "metrics": {"tasks_completed": 0, "successes": 0, "time_spent": 0, "success_rate": 0}
+    }
+
+class TestLogFolding(AgentManagerTestCase):
+    """The last record for an id wins, in both log formats"""
+
+    def write_lines(self, name, lines):
+        with open(os.path.join(self.data_dir, name), "w") as f:
+            f.writelines(line + "\n" for line in lines)
+
+    def test_duplicate_agent_records_fold_to_the_last(self):
+        self.write_lines("active_agents.jsonl", [
+            json.dumps(_agent("a1", task="old")),
+            # Lines written before the bare format carried an id prefix
+            "a2 " + json.dumps(_agent("a2")),
+            json.dumps(_agent("a1", status="working", task="new")),
+        ])
+        manager = self.manager()
+        self.assertEqual(list(manager.agents), ["a1", "a2"])
+        self.assertEqual(manager.agents["a1"]["current_task"], "new")
+        self.assertEqual(manager.get_agent_summary()["by_status"], {"working": 1, "idle": 1})
+
+    def test_duplicate_todo_records_fold_to_the_last(self):
+        todo = {"id": "t1", "agent_id": "a1", "title": "x", "status": "pending"}
+        self.write_lines("agent_todos.jsonl", [
+            json.dumps(todo),
+            "t2 " + json.dumps({**todo, "id": "t2"}),
+            json.dumps({**todo, "status": "completed"}),
+        ])
+        todos = self.manager().get_agent_todos("a1")
+        self.assertEqual([t["id"] for t in todos], ["t2", "t1"])
+        self.assertEqual(todos[1]["status"], "completed")
+
+class TestCompaction(AgentManagerTestCase):
+    """Rewriting the logs down to one record per id"""
+
+    def test_reload_after_agent_compaction(self):
+        manager = self.manager(write_behind=False)
+        agent_id = manager.spawn_agent(AgentPersonality.CADET, "task-1")
+        for n in range(80):
+            manager.add_agent_thought(agent_id, f"step {n}")
+        self.assertLess(len(self.read_lines()), 80)
+        reloaded = self.manager()
+        self.assertEqual(reloaded.agents[agent_id]["current_task"], "task-1")
+        self.assertEqual([t["thought"] for t in reloaded.agents[agent_id]["thoughts"]][-2:],
+                         ["step 78", "step 79"])
+
+    def test_reload_after_todo_compaction(self):
+        manager = self.manager()
+        todo_id = manager.create_todo_entry("agent-1", "title", "")
+        for n in range(80):
+            manager.update_todo_status(todo_id, f"status-{n}")
+        self.assertLess(len(self.read_lines("agent_todos.jsonl")), 80)
+        todos = self.manager().get_agent_todos("agent-1")
+        self.assertEqual([(t["id"], t["status"]) for t in todos], [(todo_id, "status-79")])
+
+    def test_append_after_another_manager_compacts(self):
+        first = self.manager(write_behind=False)
+        agent_id = first.spawn_agent(AgentPersonality.CADET)  # Opens first's append fd
+        second = self.manager(write_behind=False)
+        second.export_json()  # Replaces the log under first's descriptor
+        first.add_agent_thought(agent_id, "after compaction")
+        thoughts = self.manager().agents[agent_id]["thoughts"]
+        self.assertEqual(thoughts[-1]["thought"], "after compaction")
+
+class TestCompactionAcrossManagers(AgentManagerTestCase):
+    """Two managers on one directory, standing in for two processes"""
+
+    def test_agent_compaction_keeps_other_managers_agents(self):
+        first = self.manager(write_behind=False)
+        second = self.manager(write_behind=False)
+        mine = first.spawn_agent(AgentPersonality.CADET)
+        theirs = second.spawn_agent(AgentPersonality.SENIOR, "their-task")
+        # Enough superseded records to make first compact the log
+        for n in range(80):
+            first.add_agent_thought(mine, f"step {n}")
+        records = self.read_lines()
+        self.assertLess(len(records), 80)
+        self.assertEqual({record["id"] for record in records}, {mine, theirs})
+
+        fresh = self.manager()
+        self.assertEqual(fresh.agents[theirs]["current_task"], "their-task")
+        self.assertEqual(fresh.agents[mine]["thoughts"][-1]["thought"], "step 79")
+
+    def test_later_update_from_other_manager_wins(self):
+        first = self.manager(write_behind=False)
+        agent_id = first.spawn_agent(AgentPersonality.CADET)
+        second = self.manager(write_behind=False)
+        second.add_agent_thought(agent_id, "from second")
+        first.export_json()  # Compacts the live log
+        fresh = self.manager()
+        self.assertEqual(fresh.agents[agent_id]["thoughts"][-1]["thought"], "from second")
+
+    def test_todo_compaction_keeps_other_managers_todos(self):
+        first = self.manager()
+        second = self.manager()
+        mine = first.create_todo_entry("agent-1", "mine", "")
+        first.get_agent_todos()  # Load the index before second writes
+        theirs = second.create_todo_entry("agent-2", "theirs", "")
+        for n in range(80):
+            first.update_todo_status(mine, f"status-{n}")
+        records = self.read_lines("agent_todos.jsonl")
+        self.assertLess(len(records), 80)
+        self.assertEqual({record["id"] for record in records}, {mine, theirs})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Unit tests for dependency validation in jobs/job_tools.py
+"""
+
+import unittest
+import io
+import json
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+# Add jobs directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'jobs'))
+import job_tools
+
+def _job(job_id, *dependencies):
+    return {"id": job_id, "status": "pending", "priority": "medium", "dependencies": list(dependencies)}
+
+class TestStronglyConnectedComponents(unittest.TestCase):
+
+    def components(self, deps):
+        return sorted(sorted(scc) for scc in job_tools._strongly_connected_components(deps))
+
+    def test_acyclic_graph_has_singleton_components(self):
+        deps = {"a": ["b", "c"], "b": ["c"], "c": []}
+        self.assertEqual(self.components(deps), [["a"], ["b"], ["c"]])
+
+    def test_separate_and_nested_cycles(self):
+        deps = {
+            "a": ["b"], "b": ["c"], "c": ["a", "d"],  # a → b → c → a
+            "d": ["e"], "e": ["d"],                    # d ⇄ e, reached from the first cycle
+            "f": ["f"],                                # Self-dependency
+            "g": ["a", "missing"],                     # Outside any cycle
+        }
+        self.assertEqual(self.components(deps), [["a", "b", "c"], ["d", "e"], ["f"], ["g"]])
+
+    def test_deep_chain_does_not_recurse(self):
+        depth = sys.getrecursionlimit() * 2
+        deps = {f"j{n}": [f"j{n + 1}"] for n in range(depth)}
+        deps[f"j{depth}"] = ["j0"]
+        self.assertEqual(len(job_tools._strongly_connected_components(deps)), 1)
+
+class TestValidateDependencies(unittest.TestCase):
+    """validate_dependencies against a temporary jobs.jsonl"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.jobs_file = os.path.join(tmp.name, "jobs.jsonl")
+        patcher = patch.object(job_tools, "JOBS_FILE", self.jobs_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        job_tools.invalidate_jobs_cache()
+        self.addCleanup(job_tools.invalidate_jobs_cache)
+
+    def validate(self, jobs):
+        with open(self.jobs_file, "w") as f:
+            f.writelines(json.dumps(job) + "\n" for job in jobs)
+        out = io.StringIO()
+        with redirect_stdout(out):
+            valid = job_tools.validate_dependencies()
+        return valid, [line for line in out.getvalue().splitlines() if "Circular" in line]
+
+    def test_valid_graph(self):
+        valid, cycles = self.validate([_job("a", "b"), _job("b")])
+        self.assertTrue(valid)
+        self.assertEqual(cycles, [])
+
+    def test_each_cycle_reported_once_in_file_order(self):
+        valid, cycles = self.validate([
+            _job("x", "y"), _job("y", "x"),
+            _job("a", "b"), _job("b", "c"), _job("c", "a", "x"),
+            _job("s", "s"),
+            _job("free", "a"),
+        ])
+        self.assertFalse(valid)
+        self.assertEqual(cycles, [
+            "❌ Circular dependency detected: x → y → x",
+            "❌ Circular dependency detected: a → b → c → a",
+            "❌ Circular dependency detected: s → s",
+        ])
+
+    def test_shortest_path_through_a_dense_cycle(self):
+        # a reaches itself through b alone, not the longer a → c → d → a
+        valid, cycles = self.validate([
+            _job("a", "c", "b"), _job("b", "a"), _job("c", "d"), _job("d", "a"),
+        ])
+        self.assertFalse(valid)
+        self.assertEqual(cycles, ["❌ Circular dependency detected: a → b → a"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the append-only session log in jobs/time_tracker.py
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+
+# Add jobs directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'jobs'))
+import time_tracker
+from time_tracker import TimeTracker
+
+def _session(session_id, status="completed", padding=""):
+    """A session record as start_session/end_session write it"""
+    return {
+        "session_id": session_id,
+        "job_id": session_id.split("_")[0],
+        "agent": "test-agent",
+        "description": padding,
+        "status": status,
+        "start_time": "2025-02-11T10:00:00",
+        "start_timestamp": 1739268000.0,
+        "end_time": None,
+        "end_timestamp": None,
+        "duration_seconds": 60.0 if status == "completed" else None,
+        "paused_time": 0,
+        "pauses": [],
+        "created_at": "2025-02-11T10:00:00"
+    }
+
+class TimeTrackerTestCase(unittest.TestCase):
+    """Runs each test in a fresh directory holding an empty jobs/ folder,
+    since TimeTracker keeps its log at the relative jobs/time_sessions.jsonl"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        os.makedirs(os.path.join(tmp.name, "jobs"))
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp.name)
+        self.log_path = os.path.join(tmp.name, "jobs", "time_sessions.jsonl")
+
+    def write_log(self, records):
+        with open(self.log_path, "w") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+
+    def read_log(self):
+        with open(self.log_path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def tracker(self):
+        tracker = TimeTracker()
+        self.addCleanup(tracker.close)
+        return tracker
+
+class TestSessionLog(TimeTrackerTestCase):
+    """Last-record-wins folding, superseded-line accounting and vacuum"""
+
+    def test_latest_record_per_session_wins(self):
+        self.write_log([_session("job1_1", status="active"), _session("job2_2"),
+                        _session("job1_1")])
+        sessions = self.tracker()._session_index()
+        self.assertEqual(list(sessions), ["job1_1", "job2_2"])
+        self.assertEqual(sessions["job1_1"]["status"], "completed")
+
+    def test_lines_that_are_not_sessions_are_skipped(self):
+        with open(self.log_path, "w") as f:
+            f.write('[1, 2]\n{"no_session_id": true}\nnot json\n')
+            f.write(json.dumps(_session("job1_1")) + "\n")
+        tracker = self.tracker()
+        with patch("builtins.print"):
+            self.assertEqual(list(tracker._session_index()), ["job1_1"])
+            self.assertEqual(tracker.vacuum(), 3)
+        self.assertEqual([r["session_id"] for r in self.read_log()], ["job1_1"])
+
+    def test_superseded_counts_file_and_pending_lines(self):
+        self.write_log([_session("job1_1", status="active"), _session("job1_1"),
+                        _session("job2_2", status="active")])
+        tracker = self.tracker()
+        tracker._session_index()
+        self.assertEqual(tracker._superseded, 1)
+        tracker.append_session(_session("job2_2"))
+        self.assertEqual(tracker._superseded, 2)
+        tracker.append_session(_session("job3_3"))
+        self.assertEqual(tracker._superseded, 2)
+        self.assertEqual(tracker.vacuum(), 2)
+        self.assertEqual(tracker._superseded, 0)
+
+    def test_reload_after_vacuum(self):
+        self.write_log([_session("job1_1", status="active"), _session("job1_1"),
+                        _session("job2_2")])
+        self.tracker().vacuum()
+        sessions = self.tracker().load_sessions()
+        self.assertEqual([s["session_id"] for s in sessions], ["job1_1", "job2_2"])
+        self.assertEqual(sessions[0]["status"], "completed")
+        self.assertEqual(len(self.read_log()), 2)
+
+    def test_append_after_another_tracker_vacuums(self):
+        first = self.tracker()
+        first.append_session(_session("job1_1", status="active"))
+        first.flush()  # Leaves first's append descriptor open on the old file
+        second = self.tracker()
+        second.append_session(_session("job1_1"))
+        second.vacuum()
+        first.append_session(_session("job2_2"))
+        first.flush()
+        ids = [r["session_id"] for r in self.read_log()]
+        self.assertEqual(ids, ["job1_1", "job2_2"])
+
+class TestAutomaticVacuum(TimeTrackerTestCase):
+    """maybe_vacuum after the CLI commands that append"""
+
+    def write_oversized_log(self):
+        # 50 live sessions, each rewritten 120 times, padded past VACUUM_MIN_BYTES
+        padding = "x" * 300
+        records = [_session(f"job{n}_{n}", status="active", padding=padding)
+                   for _ in range(120) for n in range(50)]
+        self.write_log(records)
+        self.assertGreaterEqual(os.path.getsize(self.log_path), time_tracker.VACUUM_MIN_BYTES)
+        return len(records)
+
+    def run_cli(self, *args):
+        # Close main()'s tracker here rather than at exit, when the working
+        # directory is no longer this test's
+        trackers = []
+        def make_tracker():
+            trackers.append(TimeTracker())
+            return trackers[-1]
+        with patch.object(sys, "argv", ["time_tracker.py", *args]), \
+             patch.object(time_tracker, "TimeTracker", make_tracker), \
+             patch("builtins.print"):
+            try:
+                time_tracker.main()
+            finally:
+                for tracker in trackers:
+                    tracker.close()
+
+    def test_start_vacuums_oversized_log(self):
+        self.write_oversized_log()
+        self.run_cli("start", "newjob", "test-agent")
+        records = self.read_log()
+        self.assertEqual(len(records), 51)
+        self.assertEqual(len({r["session_id"] for r in records}), 51)
+
+    def test_end_vacuums_oversized_log(self):
+        self.write_oversized_log()
+        self.run_cli("end", "job7_7")
+        self.assertEqual(len(self.read_log()), 50)
+
+    def test_read_only_command_leaves_log_alone(self):
+        line_count = self.write_oversized_log()
+        self.run_cli("all")
+        self.assertEqual(len(self.read_log()), line_count)
+
+    def test_small_log_is_not_vacuumed(self):
+        self.write_log([_session("job1_1")] * 10)
+        tracker = self.tracker()
+        with patch("builtins.print"):
+            tracker.start_session("job2", "test-agent")
+        self.assertEqual(tracker.maybe_vacuum(), 0)
+        tracker.flush()
+        self.assertEqual(len(self.read_log()), 11)
+
+if __name__ == '__main__':
+    unittest.main()
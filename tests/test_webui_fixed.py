@@ -1,358 +0,0 @@
-#!/usr/bin/env python3
-"""
-Comprehensive unit tests for Stratavore WebUI - Fixed version
-Tests all functionality including data loading, agent management, error handling
-"""
-
-import unittest
-import json
-import tempfile
-import os
-import sys
-import shutil
-from pathlib import Path
-from unittest.mock import patch, MagicMock
-import time
-
-class TestWebUI(unittest.TestCase):
-    
-    def setUp(self):
-        """Set up test environment"""
-        self.test_dir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-        os.chdir(self.test_dir)
-        
-        # Create test data
-        self.create_test_data()
-    
-    def tearDown(self):
-        """Clean up test environment"""
-        os.chdir(self.original_cwd)
-        shutil.rmtree(self.test_dir)
-    
-    def create_test_data(self):
-        """Create test data files"""
-        # Create mock jobs.jsonl
-        jobs_data = [
-            {
-                "id": "test-job-1",
-                "title": "Test Job 1",
-                "description": "Test description",
-                "status": "in_progress",
-                "priority": "high",
-                "created_at": "2025-02-11T10:00:00Z",
-                "updated_at": "2025-02-11T10:00:00Z",
-                "assignee": "test-agent",
-                "labels": ["test"],
-                "estimated_hours": 2,
-                "actual_hours": 1,
-                "dependencies": [],
-                "deliverables": ["deliverable1"]
-            },
-            {
-                "id": "test-job-2", 
-                "title": "Test Job 2",
-                "description": "Another test",
-                "status": "pending",
-                "priority": "medium",
-                "created_at": "2025-02-11T11:00:00Z",
-                "updated_at": "2025-02-11T11:00:00Z",
-                "assignee": None,
-                "labels": ["test"],
-                "estimated_hours": 3,
-                "actual_hours": None,
-                "dependencies": [],
-                "deliverables": ["deliverable2"]
-            }
-        ]
-        
-        # Create mock directory structure
-        os.makedirs("jobs", exist_ok=True)
-        with open("jobs/jobs.jsonl", "w") as f:
-            for job in jobs_data:
-                f.write(json.dumps(job) + "\n")
-        
-        # Create mock progress.json
-        progress_data = {
-            "total_jobs": 8,
-            "pending": 5,
-            "in_progress": 1,
-            "completed": 1,
-            "last_updated": "2025-02-11T16:00:00Z"
-        }
-        
-        with open("jobs/progress.json", "w") as f:
-            json.dump(progress_data, f)
-        
-        # Create mock time_sessions.jsonl
-        time_sessions_data = [
-            {
-                "session_id": "test-session-1",
-                "job_id": "test-job-1",
-                "agent": "test-agent",
-                "status": "active",
-                "start_time": "2025-02-11T15:00:00Z",
-                "start_timestamp": time.time() - 3600,
-                "end_time": None,
-                "end_timestamp": None,
-                "duration_seconds": None,
-                "paused_time": 0,
-                "pauses": [],
-                "description": "Test session",
-                "created_at": "2025-02-11T15:00:00Z"
-            },
-            {
-                "session_id": "test-session-2",
-                "job_id": "test-job-2",
-                "agent": "test-agent",
-                "status": "completed",
-                "start_time": "2025-02-11T10:00:00Z",
-                "start_timestamp": time.time() - 7200,
-                "end_time": "2025-02-11T12:00:00Z",
-                "end_timestamp": time.time() - 3600,
-                "duration_seconds": 3600,
-                "paused_time": 0,
-                "pauses": [],
-                "created_at": "2025-02-11T10:00:00Z"
-            }
-        ]
-        
-        with open("jobs/time_sessions.jsonl", "w") as f:
-            for session in time_sessions_data:
-                f.write(json.dumps(session) + "\n")
-        
-        # Create mock agents data
-        agents_data = {
-            "test-agent-1": {
-                "id": "test-agent-1",
-                "personality": "test",
-                "status": "working",
-                "current_task": "test-job-1",
-                "thoughts": [
-                    {
-                        "timestamp": "2025-02-11T15:00:00Z",
-                        "thought": "Starting work on test job"
-                    }
-                ]
-            },
-            "test-agent-2": {
-                "id": "test-agent-2",
-                "personality": "test",
-                "status": "idle",
-                "current_task": None,
-                "thoughts": [],
-                "metrics": {
-                    "tasks_completed": 2
-                }
-            }
-        }
-        
-        with open("agents/active_agents.jsonl", "w") as f:
-            for agent_id, data in agents_data.items():
-                f.write(f"{agent_id} {json.dumps(data)}\n")
-
-class TestWebUIComponents(TestWebUI):
-    
-    def test_format_duration_function(self):
-        """Test duration formatting logic independently"""
-        def formatDuration(seconds):
-            if not seconds or seconds < 0:
-                return "0:00:00"
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            secs = int(seconds % 60)
-            return f"{hours}:{minutes:02d}:{secs:02d}"
-        
-        # Test cases
-        self.assertEqual(formatDuration(0), "0:00:00")
-        self.assertEqual(formatDuration(3661), "1:01:01")
-        self.assertEqual(formatDuration(3600), "1:00:00")
-        self.assertEqual(formatDuration(30), "0:00:30")
-    
-    def test_connection_status_emoji_mapping(self):
-        """Test connection status emoji logic"""
-        status_mapping = {
-            "online": "🟢",
-            "offline": "🔴",
-            "loading": "🟡",
-            "error": "❌"
-        }
-        
-        for status, expected_emoji in status_mapping.items():
-            self.assertEqual(status_mapping[status], expected_emoji)
-
-class TestDataLoading(TestWebUI):
-    
-    def test_load_jobs_success(self):
-        """Test successful jobs data loading"""
-        # Import server functions directly
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'webui'))
-        from server import load_jobs_data
-        
-        # Mock file reading
-        with patch('builtins.open') as mock_open:
-            mock_open.return_value.__enter__.return_value.read.return_value = json.dumps([
-                {"id": "test-job", "title": "Test", "status": "active"}
-            ])
-            
-            jobs = load_jobs_data()
-            
-            self.assertEqual(len(jobs), 1)
-            self.assertEqual(jobs[0]["id"], "test-job")
-    
-    def test_load_jobs_file_not_found(self):
-        """Test handling of missing jobs file"""
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'webui'))
-        from server import load_jobs_data
-        
-        with patch('builtins.open', side_effect=FileNotFoundError("File not found")):
-            jobs = load_jobs_data()
-            self.assertEqual(jobs, [])
-    
-    def test_api_response_structure(self):
-        """Test API response has required fields"""
-        # This tests the expected response structure
-        required_fields = ['jobs', 'progress', 'time_sessions', 'agents', 'status', 'timestamp']
-        
-        # Mock a complete response
-        response_data = {
-            'jobs': [{'id': 'test-job'}],
-            'progress': {'total_jobs': 1},
-            'time_sessions': [{'session_id': 'test-session'}],
-            'agents': {'test-agent': {'id': 'test-agent'}},
-            'status': 'success',
-            'timestamp': time.time()
-        }
-        
-        for field in required_fields:
-            self.assertIn(field, response_data)
-        
-        self.assertEqual(response_data['status'], 'success')
-
-class TestErrorHandling(TestWebUI):
-    
-    def test_json_error_handling(self):
-        """Test handling of malformed JSON"""
-        # Test that JSON parsing errors are handled gracefully
-        try:
-            json.loads("invalid json{")
-            self.fail("Expected JSON parsing error")
-        except json.JSONDecodeError:
-            pass  # Expected behavior
-    
-    def test_file_error_logging(self):
-        """Test that file errors are logged"""
-        # This tests that file operation errors are caught
-        try:
-            with open("nonexistent_file.json", "r") as f:
-                f.read()
-            self.fail("Expected FileNotFoundError")
-        except FileNotFoundError:
-            pass  # Expected behavior
-
-class TestIntegration(TestWebUI):
-    
-    def test_page_load_components(self):
-        """Test that required HTML components exist"""
-        html_path = os.path.join(os.path.dirname(__file__), '..', 'webui', 'index.html')
-        with open(html_path, 'r') as f:
-            html_content = f.read()
-        
-        required_components = [
-            'function loadData()',  # Data loading function
-            'function updateUI()',    # UI update function
-            'function formatDuration()',  # Duration formatting
-            'DOMContentLoaded',         # Page load event
-            'status-indicator',       # Status indicators
-            'refresh-btn',            # Refresh buttons
-            'agents-status-panel'       # Agent status panel
-        ]
-        
-        for component in required_components:
-            self.assertIn(component, html_content)
-
-class TestPageValidation(TestWebUI):
-    
-    def test_error_indicators_present(self):
-        """Test that error indicators are present in HTML"""
-        html_path = os.path.join(os.path.dirname(__file__), '..', 'webui', 'index.html')
-        with open(html_path, 'r') as f:
-            html_content = f.read()
-        
-        error_indicators = [
-            'class="error"',           # Error class
-            '❌',                    # Error emoji
-            'catch',                   # Error handling
-            'try {'                   # Try block for error handling
-        ]
-        
-        for indicator in error_indicators:
-            self.assertIn(indicator, html_content)
-
-def run_tests():
-    """Run all tests with proper import path setup"""
-    # Add current directory to path
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    if current_dir not in sys.path:
-        sys.path.insert(0, current_dir)
-    
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Add all test classes
-    test_classes = [TestWebUIComponents, TestDataLoading, TestErrorHandling, TestIntegration, TestPageValidation]
-    
-    for test_class in test_classes:
-        tests = loader.loadTestsFromTestCase(test_class)
-        suite.addTests(tests)
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    # Print summary
-    print(f"\n{'='*60}")
-    print(f"🧪 WEBUI UNIT TEST SUMMARY")
-    print(f"{'='*60}")
-    
-    total_tests = result.testsRun
-    failures = len(result.failures)
-    errors = len(result.errors)
-    success = total_tests - failures - errors
-    
-    print(f"Total Tests: {total_tests}")
-    print(f"✅ Successful: {success}")
-    print(f"❌ Failures: {failures}")
-    print(f"💥 Errors: {errors}")
-    print(f"Success Rate: {(success/total_tests*100):.1f}%")
-    
-    if failures > 0:
-        print(f"\n❌ FAILED TESTS:")
-        for test, error in result.failures:
-            print(f"  - {test}: {error}")
-    
-    if errors > 0:
-        print(f"\n💥 ERROR TESTS:")
-        for test, error in result.errors:
-            print(f"  - {test}: {error}")
-    
-    print(f"\n🎯 TEST COVERAGE:")
-    coverage_areas = [
-        ("Data Loading", "✅", "Jobs, progress, time sessions loading"),
-        ("Agent Management", "✅", "Agent spawning, status tracking"),
-        ("Error Handling", "✅", "JSON parsing, file errors"),
-        ("UI Components", "✅", "Functions, events, status indicators"),
-        ("Integration", "✅", "API endpoints, response formats"),
-        ("Page Validation", "✅", "Error indicators, validation"),
-        ("HTML Structure", "✅", "Required components present")
-    ]
-    
-    for area, status, description in coverage_areas:
-        print(f"  {status} {area}: {description}")
-    
-    print(f"{'='*60}")
-    
-    return result.wasSuccessful()
-
-if __name__ == "__main__":
-    run_tests()
\ No newline at end of file
@@ -30,10 +30,19 @@ def validate_agents():
             print("  ⚠️  Agent data file is empty")
             return False
         
-        # Parse agents from JSONL format
+        # Parse agents from JSONL format. Lines are bare JSON objects keyed
+        # by their "id" (older files prefix them with "<id> "); later lines
+        # for the same agent replace earlier ones.
         agents = {}
         for line in agents_content.split('\n'):
-            if line.strip():
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith('{'):
+                agent_data = json.loads(line)
+                if isinstance(agent_data, dict) and 'id' in agent_data:
+                    agents[agent_data['id']] = agent_data
+            else:
                 parts = line.split(' ', 1)
                 if len(parts) == 2:
                     agent_id, agent_data = parts[0], json.loads(parts[1])
@@ -13,10 +13,12 @@ from typing import Dict, Any, Optional
 class BaseHandler:
     """Base class with common functionality for all API handlers"""
     
-    def __init__(self):
-        # Resolve paths relative to webui directory
-        self.webui_dir = os.path.dirname(os.path.abspath(__file__))
-        self.root_dir = os.path.dirname(self.webui_dir)
+    def __init__(self, base_dir: Optional[str] = None):
+        # base_dir holds jobs/ and agents/; by default the repo root, three
+        # levels above webui/backend/handlers/
+        handlers_dir = os.path.dirname(os.path.abspath(__file__))
+        self.webui_dir = os.path.dirname(os.path.dirname(handlers_dir))
+        self.root_dir = base_dir if base_dir is not None else os.path.dirname(self.webui_dir)
         
         # Common paths
         self.jobs_dir = os.path.join(self.root_dir, "jobs")
@@ -91,11 +93,22 @@ class BaseHandler:
             print(f"[WARN] Could not read {file_path}: {exc}")
         return results
     
+    def _load_jsonl_latest(self, file_path: str, key: str) -> list:
+        """Like _load_jsonl, but keeps only the latest record per key."""
+        # time_sessions.jsonl appends the updated record when a session
+        # ends; records without the key are all kept
+        latest = {}
+        for i, record in enumerate(self._load_jsonl(file_path)):
+            record_key = record.get(key) if isinstance(record, dict) else None
+            latest[record_key if record_key is not None else (None, i)] = record
+        return list(latest.values())
+    
     def _load_prefixed_jsonl(self, file_path: str) -> dict:
         """
         Read a JSONL file where each line is:  <key> <json_object>
         Returns a dict keyed by the prefix token.
-        Handles lines that are pure JSON objects (no prefix) gracefully.
+        Lines that are pure JSON objects (no prefix) are keyed by their "id";
+        later lines for the same key replace earlier ones.
         """
         results = {}
         try:
@@ -105,7 +118,9 @@ class BaseHandler:
                     if not line:
                         continue
                     parts = line.split(" ", 1)
-                    if len(parts) == 2:
+                    # Bare JSON lines (agent_manager's current format) may
+                    # contain spaces, so never treat them as "<key> <json>"
+                    if len(parts) == 2 and not line.startswith("{"):
                         key, payload = parts
                         try:
                             results[key] = json.loads(payload)
@@ -127,39 +142,21 @@ class BaseHandler:
     
     def _load_prefixed_jsonl_list(self, file_path: str) -> list:
         """Like _load_prefixed_jsonl but returns a list of the JSON values."""
-        results = []
-        try:
-            with open(file_path, "r", encoding="utf-8") as fh:
-                for line in fh:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    parts = line.split(" ", 1)
-                    if len(parts) == 2:
-                        try:
-                            results.append(json.loads(parts[1]))
-                        except json.JSONDecodeError as exc:
-                            print(f"[WARN] Skipping malformed line in {file_path}: {exc}")
-                    else:
-                        try:
-                            obj = json.loads(line)
-                            results.append(obj)
-                        except json.JSONDecodeError:
-                            pass
-        except FileNotFoundError:
-            pass
-        except OSError as exc:
-            print(f"[WARN] Could not read {file_path}: {exc}")
-        return results
+        # Files such as agent_todos.jsonl append a new record per update,
+        # so collapse them by key before returning
+        return list(self._load_prefixed_jsonl(file_path).values())
     
     def _get_agent_manager(self):
         """Import and return an AgentManager instance."""
         import sys
-        if self.agents_dir not in sys.path:
-            sys.path.insert(0, self.agents_dir)
+        # The code lives in the repo even when base_dir points elsewhere
+        agents_code_dir = os.path.join(os.path.dirname(self.webui_dir), "agents")
+        if agents_code_dir not in sys.path:
+            sys.path.insert(0, agents_code_dir)
         try:
             from agent_manager import AgentManager
-            return AgentManager()
+            # Callers never flush, so records must be on disk before they respond
+            return AgentManager(write_behind=False)
         except ImportError as exc:
             raise RuntimeError(f"Could not import AgentManager: {exc}")
     
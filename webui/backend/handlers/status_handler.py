@@ -6,13 +6,14 @@ Handles /api/status, /api/health, and /api/agents endpoints
 
 import time
 import json
+from typing import Optional
 from .base_handler import BaseHandler
 
 class StatusHandler(BaseHandler):
     """Handler for status and data retrieval endpoints"""
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, base_dir: Optional[str] = None):
+        super().__init__(base_dir)
         self.server_start_time = time.time()
     
     def handle_status(self, handler):
@@ -34,7 +35,7 @@ class StatusHandler(BaseHandler):
                 pass
             
             # Load time sessions
-            time_sessions = self._load_jsonl(self.time_sessions_file)
+            time_sessions = self._load_jsonl_latest(self.time_sessions_file, "session_id")
             
             # Load agent data
             agents = self._load_prefixed_jsonl(self.agents_file)
@@ -207,7 +208,7 @@ class StatusHandler(BaseHandler):
         # Simulate loading all data files
         self._load_jsonl(self.jobs_file)
         self._load_prefixed_jsonl(self.agents_file)
-        self._load_jsonl(self.time_sessions_file)
+        self._load_jsonl_latest(self.time_sessions_file, "session_id")
         self._load_prefixed_jsonl_list(self.agent_todos_file)
         
         return round((time.time() - start_time) * 1000, 2)  # Convert to milliseconds
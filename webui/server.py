@@ -47,6 +47,14 @@ class APIResponse:
 class DataLoader:
     """Handles all data loading operations"""
     
+    def __init__(self, base_dir: Optional[str] = None):
+        # Directory holding jobs/ and agents/; the repo root unless given
+        self.base_dir = base_dir if base_dir is not None else _ROOT
+    
+    def path(self, *parts: str) -> str:
+        """Path of a data file relative to base_dir"""
+        return os.path.join(self.base_dir, *parts)
+    
     @staticmethod
     def load_jsonl(path: str) -> List[Dict]:
         """Read a JSONL file and return a list of parsed objects"""
@@ -66,6 +74,17 @@ class DataLoader:
             logger.warning(f"Could not read {path}: {exc}")
         return results
 
+    @staticmethod
+    def load_jsonl_latest(path: str, key: str) -> List[Dict]:
+        """Read a JSONL file, keeping only the latest record per key"""
+        # time_sessions.jsonl appends the updated record when a session
+        # ends; records without the key are all kept
+        latest: Dict[Any, Dict] = {}
+        for i, record in enumerate(DataLoader.load_jsonl(path)):
+            record_key = record.get(key) if isinstance(record, dict) else None
+            latest[record_key if record_key is not None else (None, i)] = record
+        return list(latest.values())
+
     @staticmethod
     def load_prefixed_jsonl(path: str) -> Dict[str, Dict]:
         """Read a JSONL file with prefixed keys"""
@@ -77,7 +96,9 @@ class DataLoader:
                     if not line:
                         continue
                     parts = line.split(" ", 1)
-                    if len(parts) == 2:
+                    # Bare JSON lines (agent_manager's current format) may
+                    # contain spaces, so never treat them as "<key> <json>"
+                    if len(parts) == 2 and not line.startswith("{"):
                         key, payload = parts
                         try:
                             results[key] = json.loads(payload)
@@ -114,11 +135,11 @@ class StatusAPIHandler(BaseAPIHandler):
     def handle_request(self, handler, path: str, query_params: Dict[str, str], body: Dict[str, Any]) -> APIResponse:
         """Return comprehensive status data"""
         try:
-            jobs = self.data_loader.load_jsonl(os.path.join(_ROOT, "jobs", "jobs.jsonl"))
+            jobs = self.data_loader.load_jsonl(self.data_loader.path("jobs", "jobs.jsonl"))
             
             # Load progress data
             progress = {}
-            progress_path = os.path.join(_ROOT, "jobs", "progress.json")
+            progress_path = self.data_loader.path("jobs", "progress.json")
             try:
                 with open(progress_path, "r", encoding="utf-8") as fh:
                     raw_progress = fh.read().strip()
@@ -127,15 +148,16 @@ class StatusAPIHandler(BaseAPIHandler):
             except (FileNotFoundError, json.JSONDecodeError):
                 pass
 
-            time_sessions = self.data_loader.load_jsonl(
-                os.path.join(_ROOT, "jobs", "time_sessions.jsonl")
+            time_sessions = self.data_loader.load_jsonl_latest(
+                self.data_loader.path("jobs", "time_sessions.jsonl"), "session_id"
             )
             agents = self.data_loader.load_prefixed_jsonl(
-                os.path.join(_ROOT, "agents", "active_agents.jsonl")
-            )
-            agent_todos = self.data_loader.load_jsonl(
-                os.path.join(_ROOT, "agents", "agent_todos.jsonl")
+                self.data_loader.path("agents", "active_agents.jsonl")
             )
+            # Todo updates are appended as new records; keep the latest per id
+            agent_todos = list(self.data_loader.load_prefixed_jsonl(
+                self.data_loader.path("agents", "agent_todos.jsonl")
+            ).values())
 
             data = {
                 "jobs": jobs,
@@ -180,11 +202,12 @@ class AgentsAPIHandler(BaseAPIHandler):
         """Return agent-focused data with summary"""
         try:
             agents = self.data_loader.load_prefixed_jsonl(
-                os.path.join(_ROOT, "agents", "active_agents.jsonl")
-            )
-            agent_todos = self.data_loader.load_jsonl(
-                os.path.join(_ROOT, "agents", "agent_todos.jsonl")
+                self.data_loader.path("agents", "active_agents.jsonl")
             )
+            # Todo updates are appended as new records; keep the latest per id
+            agent_todos = list(self.data_loader.load_prefixed_jsonl(
+                self.data_loader.path("agents", "agent_todos.jsonl")
+            ).values())
             
             # Compute summary statistics
             summary = {
@@ -228,7 +251,9 @@ class AgentActionAPIHandler(BaseAPIHandler):
                 AgentManager = getattr(agent_manager, 'AgentManager')
                 AgentPersonality = getattr(agent_manager, 'AgentPersonality')
                 AgentStatus = getattr(agent_manager, 'AgentStatus')
-                manager = AgentManager()
+                # Written through, so the response is sent only once the
+                # change is in active_agents.jsonl for the next GET to read
+                manager = AgentManager(write_behind=False)
                 # Store enum classes for fallback usage
                 manager.AgentPersonality = AgentPersonality
                 manager.AgentStatus = AgentStatus
@@ -247,23 +272,29 @@ class AgentActionAPIHandler(BaseAPIHandler):
                     @property
                     def agents(self):
                         return {}
+                    def close(self):
+                        pass
                 manager = DummyManager()
             
-            # Determine action based on path
-            if "spawn-agent" in path:
-                return self._handle_spawn_agent(manager, body)
-            elif "assign-agent" in path:
-                return self._handle_assign_agent(manager, body)
-            elif "complete-task" in path:
-                return self._handle_complete_task(manager, body)
-            elif "agent-status" in path:
-                return self._handle_agent_status(manager, body)
-            elif "kill-agent" in path:
-                return self._handle_kill_agent(manager, body)
-            elif "batch-operation" in path:
-                return self._handle_batch_operation(manager, body)
-            else:
-                return APIResponse(status="error", error="Unknown agent action")
+            try:
+                # Determine action based on path
+                if "spawn-agent" in path:
+                    return self._handle_spawn_agent(manager, body)
+                elif "assign-agent" in path:
+                    return self._handle_assign_agent(manager, body)
+                elif "complete-task" in path:
+                    return self._handle_complete_task(manager, body)
+                elif "agent-status" in path:
+                    return self._handle_agent_status(manager, body)
+                elif "kill-agent" in path:
+                    return self._handle_kill_agent(manager, body)
+                elif "batch-operation" in path:
+                    return self._handle_batch_operation(manager, body)
+                else:
+                    return APIResponse(status="error", error="Unknown agent action")
+            finally:
+                # One manager per request; release its descriptors
+                manager.close()
                 
         except ImportError as exc:
             logger.error(f"Could not import agent_manager: {exc}")